@@ -4,6 +4,7 @@ import json
 import re
 import sys
 from collections import defaultdict
+from functools import cache
 from pathlib import Path
 
 import click
@@ -21,7 +22,11 @@ from adibuild.platforms.zynqmp import ZynqMPPlatform
 
 console = Console()
 
+# ADI release tags: YYYY_RN or YYYY_RN_Px (patch releases)
+_RELEASE_TAG_RE = re.compile(r"^(\d{4})_R(\d+)(?:_P\d+)?$")
 
+
+@cache
 def tag_to_tool_version(tag: str) -> str | None:
     """
     Map ADI release tag to tool version.
@@ -41,8 +46,7 @@ def tag_to_tool_version(tag: str) -> str | None:
     if not tag:
         return None
 
-    # Match pattern: YYYY_RN or YYYY_RN_Px (patch releases)
-    match = re.match(r"^(\d{4})_R(\d+)(?:_P\d+)?$", tag)
+    match = _RELEASE_TAG_RE.match(tag)
     if match:
         year = match.group(1)
         release = match.group(2)
@@ -338,6 +342,19 @@ def prompt_for_config() -> dict:
     return config
 
 
+def confirm_overwrite(path: Path) -> bool:
+    """
+    Ask whether an existing configuration file may be overwritten.
+
+    Args:
+        path: Path of the existing file
+
+    Returns:
+        True if the user agreed to overwrite the file
+    """
+    return click.confirm(f"Configuration already exists at {path}. Overwrite?")
+
+
 def create_default_config(output_path: Path):
     """
     Create default global configuration file.
@@ -354,13 +371,38 @@ def create_default_config(output_path: Path):
     print_success(f"Configuration created: {output_path}")
 
 
+@cache
 def load_fabric_release_info() -> dict:
-    """Load the fabric_release_info.json file."""
+    """Load the fabric_release_info.json file.
+
+    The file is parsed on first use and shared afterwards, so callers must not
+    modify the returned dict.
+    """
     json_path = Path(__file__).parent.parent / "fabric_release_info.json"
-    if not json_path.exists():
-        raise FileNotFoundError(f"fabric_release_info.json not found at {json_path}")
-    with open(json_path) as f:
-        return json.load(f)
+    try:
+        content = json_path.read_bytes()
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"fabric_release_info.json not found at {json_path}"
+        ) from None
+    return json.loads(content)
+
+
+@cache
+def _simpleimage_preset_table(tag: str) -> tuple[dict, ...]:
+    """Build the simpleImage preset rows for a tag once per process."""
+    # Convert dts_path to simpleImage target
+    # e.g., "arch/microblaze/boot/dts/vcu118_ad9081.dts" -> "simpleImage.vcu118_ad9081"
+    return tuple(
+        {
+            "project": project_name,
+            "carrier": config["carrier"],
+            "simpleimage_target": f"simpleImage.{Path(config['dts_path']).stem}",
+            "dts_path": config["dts_path"],
+        }
+        for project_name, configs in load_fabric_release_info().get(tag, {}).items()
+        for config in configs
+    )
 
 
 def get_simpleimage_presets(tag: str, carrier: str = None) -> list[dict]:
@@ -374,28 +416,12 @@ def get_simpleimage_presets(tag: str, carrier: str = None) -> list[dict]:
     Returns:
         List of dicts with keys: project, carrier, simpleimage_target, dts_path
     """
-    data = load_fabric_release_info()
-    if tag not in data:
-        return []
-
-    presets = []
-    for project_name, configs in data[tag].items():
-        for config in configs:
-            if carrier and config["carrier"] != carrier:
-                continue
-            # Convert dts_path to simpleImage target
-            # e.g., "arch/microblaze/boot/dts/vcu118_ad9081.dts" -> "simpleImage.vcu118_ad9081"
-            dts_file = Path(config["dts_path"]).stem
-            simpleimage_target = f"simpleImage.{dts_file}"
-            presets.append(
-                {
-                    "project": project_name,
-                    "carrier": config["carrier"],
-                    "simpleimage_target": simpleimage_target,
-                    "dts_path": config["dts_path"],
-                }
-            )
-    return presets
+    # Copy the cached rows so callers can't alter them for later lookups
+    return [
+        dict(preset)
+        for preset in _simpleimage_preset_table(tag)
+        if not carrier or preset["carrier"] == carrier
+    ]
 
 
 def prompt_simpleimage_selection(
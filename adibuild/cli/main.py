@@ -8,6 +8,7 @@ from typing import Any
 import click
 
 from adibuild.cli.helpers import (
+    confirm_overwrite,
     create_default_config,
     display_build_summary,
     display_platforms,
@@ -20,7 +21,7 @@ from adibuild.cli.helpers import (
     tag_to_tool_version,
     validate_config_file,
 )
-from adibuild.core.config import BuildConfig
+from adibuild.core.config import BuildConfig, default_schema_path
 from adibuild.core.executor import BuildError
 from adibuild.projects.atf import ATFBuilder
 from adibuild.projects.boot import BootBuilder
@@ -34,6 +35,7 @@ from adibuild.projects.linux import LinuxBuilder
 from adibuild.projects.noos import NoOSBuilder
 from adibuild.projects.uboot import UBootBuilder
 from adibuild.utils.logger import setup_logging
+from adibuild.utils.paths import adibuild_home
 
 
 def _load_vivado_credentials(non_interactive: bool):
@@ -1944,19 +1946,19 @@ def config():
 
 
 @config.command("init")
-def config_init():
+@click.option(
+    "--yes", "-y", is_flag=True, help="Overwrite an existing configuration without asking"
+)
+def config_init(yes):
     """
     Initialize global configuration file.
 
     Creates ~/.adibuild/config.yaml with default settings.
     """
-    config_path = Path.home() / ".adibuild" / "config.yaml"
+    config_path = adibuild_home() / "config.yaml"
 
-    if config_path.exists():
-        if not click.confirm(
-            f"Configuration already exists at {config_path}. Overwrite?"
-        ):
-            return
+    if config_path.exists() and not yes and not confirm_overwrite(config_path):
+        return
 
     create_default_config(config_path)
 
@@ -1969,12 +1971,7 @@ def config_validate(config_file):
 
     Checks if configuration file is valid according to the JSON schema.
     """
-    schema_path = (
-        Path(__file__).parent.parent.parent
-        / "configs"
-        / "schema"
-        / "linux_config.schema.json"
-    )
+    schema_path = default_schema_path()
 
     if not schema_path.exists():
         print_error(f"Schema file not found: {schema_path}")
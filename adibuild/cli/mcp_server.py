@@ -4,7 +4,7 @@ from fastmcp import FastMCP
 
 from adibuild import __version__
 from adibuild.cli.helpers import get_simpleimage_presets, tag_to_tool_version
-from adibuild.core.config import BuildConfig, ConfigurationError
+from adibuild.core.config import BuildConfig, ConfigurationError, default_schema_path
 from adibuild.core.toolchain import (
     ArmToolchain,
     SystemToolchain,
@@ -719,12 +719,7 @@ def validate_configuration(config_file: str) -> str:
         config_file: Path to configuration file
     """
     try:
-        schema_path = (
-            Path(__file__).parent.parent.parent
-            / "configs"
-            / "schema"
-            / "linux_config.schema.json"
-        )
+        schema_path = default_schema_path()
 
         if not schema_path.exists():
             return f"Error: Schema file not found: {schema_path}"
@@ -13,6 +13,7 @@ from adibuild.core.executor import BuildError, BuildExecutor, ScriptBuilder
 from adibuild.core.toolchain import ToolchainInfo
 from adibuild.platforms.base import Platform
 from adibuild.utils.logger import get_logger
+from adibuild.utils.paths import adibuild_home
 
 
 class BuilderBase(ABC):
@@ -39,7 +40,7 @@ class BuilderBase(ABC):
         """
         self.config = config
         self.platform = platform
-        self.work_dir = work_dir or (Path.home() / ".adibuild" / "work")
+        self.work_dir = work_dir or (adibuild_home() / "work")
         self.work_dir.mkdir(parents=True, exist_ok=True)
         self.script_mode = script_mode
         self.runner = runner
@@ -119,7 +120,7 @@ class BuilderBase(ABC):
             response = requests.get(url, stream=True)
             response.raise_for_status()
             with open(dst, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=1024 * 1024):
                     f.write(chunk)
 
     def make_directory(self, path: Path) -> None:
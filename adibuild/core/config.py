@@ -1,6 +1,8 @@
 """Configuration management for build system."""
 
+import copy
 import json
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -8,6 +10,36 @@ import jsonschema
 import yaml
 
 from adibuild.utils.logger import get_logger
+from adibuild.utils.paths import adibuild_home
+
+# LibYAML-backed loader when PyYAML was built with it, same safe semantics
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@cache
+def default_schema_path(name: str = "linux_config.schema.json") -> Path:
+    """Return the path of a JSON schema shipped in configs/schema."""
+    return Path(__file__).parent.parent.parent / "configs" / "schema" / name
+
+
+@lru_cache(maxsize=32)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    """Parse a YAML file, keyed on its mtime and size so edits miss the cache."""
+    with open(path) as f:
+        return yaml.load(f, Loader=_YAML_LOADER)
+
+
+@lru_cache(maxsize=4)
+def _get_validator(path: str, mtime_ns: int, size: int) -> Any:
+    """Load a JSON schema and compile its validator, keyed like _load_yaml_cached.
+
+    The schema itself is checked once here instead of on every validation.
+    """
+    with open(path) as f:
+        schema = json.load(f)
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
 
 
 class ConfigurationError(Exception):
@@ -48,9 +80,10 @@ class BuildConfig:
             raise ConfigurationError(f"Configuration file not found: {path}")
 
         try:
-            with open(path) as f:
-                data = yaml.safe_load(f)
-            return cls(data or {})
+            stat = path.stat()
+            data = _load_yaml_cached(str(path), stat.st_mtime_ns, stat.st_size)
+            # Configs are mutated through set(), never hand out the cached copy
+            return cls(copy.deepcopy(data) or {})
         except yaml.YAMLError as e:
             raise ConfigurationError(f"Failed to parse YAML file {path}: {e}") from e
 
@@ -115,7 +148,7 @@ class BuildConfig:
 
         # Load user config if exists
         if user_config_path is None:
-            user_config_path = Path.home() / ".adibuild" / "config.yaml"
+            user_config_path = adibuild_home() / "config.yaml"
 
         if Path(user_config_path).exists():
             logger.debug(f"Loading user config from {user_config_path}")
@@ -289,10 +322,13 @@ class BuildConfig:
             raise ConfigurationError(f"Schema file not found: {schema_path}")
 
         try:
-            with open(schema_path) as f:
-                schema = json.load(f)
+            stat = schema_path.stat()
+            validator = _get_validator(str(schema_path), stat.st_mtime_ns, stat.st_size)
 
-            jsonschema.validate(self._data, schema)
+            # Report the same error jsonschema.validate() would pick
+            error = jsonschema.exceptions.best_match(validator.iter_errors(self._data))
+            if error is not None:
+                raise error
             self.logger.debug("Configuration validation passed")
             return True
 
@@ -17,6 +17,7 @@ from adibuild.core.vivado import (
     VivadoInstallRequest,
 )
 from adibuild.utils.logger import get_logger
+from adibuild.utils.paths import adibuild_home
 
 
 class DockerError(RuntimeError):
@@ -133,7 +134,7 @@ def build_docker_execution_config(
 ) -> DockerExecutionConfig:
     """Create a Docker execution config with mounts for source, cache, and outputs."""
     effective_cwd = (cwd or Path.cwd()).resolve()
-    adibuild_root = (Path.home() / ".adibuild").resolve()
+    adibuild_root = adibuild_home().resolve()
     docker_home = adibuild_root / "docker-home"
     docker_home.mkdir(parents=True, exist_ok=True)
 
@@ -57,10 +57,12 @@ class ScriptBuilder:
 
         # Initialize script
         with open(self.script_path, "w") as f:
-            f.write("#!/bin/bash\n")
-            f.write("# Auto-generated build script by adibuild\n")
-            f.write("set -e  # Exit on error\n")
-            f.write("set -x  # Print commands\n\n")
+            f.write(
+                "#!/bin/bash\n"
+                "# Auto-generated build script by adibuild\n"
+                "set -e  # Exit on error\n"
+                "set -x  # Print commands\n\n"
+            )
 
     def write_command(
         self,
@@ -77,28 +79,43 @@ class ScriptBuilder:
             env: Environment variables
         """
         with open(self.script_path, "a") as f:
-            f.write("\n")
+            f.write(self._render_command(command, cwd, env))
 
-            # Add directory change if needed
-            if cwd:
-                f.write(f"mkdir -p {cwd}\n")
-                f.write(f"cd {cwd}\n")
+    @staticmethod
+    def _render_command(
+        command: str | list[str],
+        cwd: Path | None = None,
+        env: dict[str, str] | None = None,
+    ) -> str:
+        """
+        Render a command block as script text.
 
-            # Add environment variables
-            if env:
-                for key, value in env.items():
-                    f.write(f"export {key}='{value}'\n")
+        Args:
+            command: Command string or list
+            cwd: Working directory
+            env: Environment variables
 
-            # Write command
-            if isinstance(command, list):
-                cmd_str = shlex.join(command)
-            else:
-                cmd_str = command
+        Returns:
+            Script text for the command, written with a single write call
+        """
+        lines = [""]
 
-            f.write(f"{cmd_str}\n")
+        # Add directory change if needed
+        if cwd:
+            lines.append(f"mkdir -p {cwd}")
+            lines.append(f"cd {cwd}")
+
+        # Add environment variables
+        if env:
+            lines.extend(f"export {key}='{value}'" for key, value in env.items())
+
+        # Write command
+        if isinstance(command, list):
+            lines.append(shlex.join(command))
+        else:
+            lines.append(command)
 
-            # Cleanup environment (optional, but good for isolation)
-            # For now we rely on subshells or just overwriting in next steps if needed
+        return "\n".join(lines) + "\n"
 
     def write_comment(self, comment: str) -> None:
         """Write comment to script."""
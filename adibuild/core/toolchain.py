@@ -6,12 +6,15 @@ import subprocess
 import tarfile
 import tempfile
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 
 import requests
+import urllib3
 
 from adibuild.utils.logger import get_logger
+from adibuild.utils.paths import adibuild_home
 
 
 class ToolchainError(Exception):
@@ -20,7 +23,7 @@ class ToolchainError(Exception):
     pass
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolchainInfo:
     """Information about a detected toolchain."""
 
@@ -301,17 +304,24 @@ class ArmToolchain(Toolchain):
         "https://developer.arm.com/-/media/Files/downloads/",
     ]
 
-    def __init__(self, cache_dir: Path | None = None, version: str | None = None):
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        version: str | None = None,
+        session: requests.Session | None = None,
+    ):
         """
         Initialize ArmToolchain.
 
         Args:
             cache_dir: Directory to cache downloaded toolchains
             version: Specific ARM toolchain version to use
+            session: HTTP session reused across toolchain downloads
         """
         super().__init__()
-        self.cache_dir = cache_dir or Path.home() / ".adibuild" / "toolchains" / "arm"
+        self.cache_dir = cache_dir or adibuild_home() / "toolchains" / "arm"
         self.version = version
+        self.session = session or requests.Session()
         self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     def detect(self) -> ToolchainInfo | None:
@@ -386,9 +396,16 @@ class ArmToolchain(Toolchain):
 
         self.logger.info(f"Downloading ARM GNU toolchain version {arm_version}")
 
-        # Download both ARM32 and ARM64 toolchains
-        arm32_dir = self._download_toolchain(arm_version, "arm-none-linux-gnueabihf")
-        arm64_dir = self._download_toolchain(arm_version, "aarch64-none-linux-gnu")
+        # Download both ARM32 and ARM64 toolchains concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            arm32_future = executor.submit(
+                self._download_toolchain, arm_version, "arm-none-linux-gnueabihf"
+            )
+            arm64_future = executor.submit(
+                self._download_toolchain, arm_version, "aarch64-none-linux-gnu"
+            )
+            arm32_dir = arm32_future.result()
+            arm64_dir = arm64_future.result()
 
         # Build PATH
         path_additions = [
@@ -465,37 +482,32 @@ class ArmToolchain(Toolchain):
             self.logger.info(f"Downloading from {url}")
 
             try:
-                # Download to temporary file
-                with tempfile.NamedTemporaryFile(
-                    delete=False, suffix=".tar.xz"
-                ) as tmp_file:
-                    response = requests.get(url, stream=True, timeout=300)
-                    response.raise_for_status()
-
-                    total_size = int(response.headers.get("content-length", 0))
-                    downloaded = 0
-
-                    for chunk in response.iter_content(chunk_size=8192):
-                        tmp_file.write(chunk)
-                        downloaded += len(chunk)
-                        if total_size > 0:
-                            percent = (downloaded / total_size) * 100
-                            self.logger.debug(f"Download progress: {percent:.1f}%")
-
-                    tmp_path = Path(tmp_file.name)
-
-                # Extract
-                self.logger.info(f"Extracting to {self.cache_dir}")
-                with tarfile.open(tmp_path, "r:xz") as tar:
-                    tar.extractall(self.cache_dir)
+                response = self.session.get(url, stream=True, timeout=300)
+                response.raise_for_status()
+                response.raw.decode_content = True
 
-                # Clean up
-                tmp_path.unlink()
+                # Extract while downloading, staged so a failed transfer never
+                # leaves a partial toolchain where detect() would find it
+                self.logger.info(f"Extracting to {self.cache_dir}")
+                with tempfile.TemporaryDirectory(
+                    dir=self.cache_dir, prefix=".extract-"
+                ) as staging:
+                    top_level: set[str] = set()
+                    with tarfile.open(fileobj=response.raw, mode="r|xz") as tar:
+                        for member in tar:
+                            top_level.add(member.name.split("/", 1)[0])
+                            tar.extract(member, staging)
+
+                    if extract_dir.name not in top_level:
+                        raise ToolchainError(
+                            f"Archive {filename} does not contain {extract_dir.name}"
+                        )
+                    os.replace(Path(staging) / extract_dir.name, extract_dir)
 
                 self.logger.info(f"Successfully installed toolchain to {extract_dir}")
                 return extract_dir
 
-            except requests.RequestException as e:
+            except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
                 last_error = e
                 self.logger.warning(f"Failed to download from {url}: {e}")
                 continue
@@ -23,6 +23,7 @@ from typing import Protocol, runtime_checkable
 
 from adibuild.core.toolchain import ToolchainError, ToolchainInfo
 from adibuild.utils.logger import get_logger
+from adibuild.utils.paths import adibuild_home
 
 
 @runtime_checkable
@@ -519,7 +520,7 @@ class SeleniumDownloadStrategy:
         self.screenshot_dir = (
             screenshot_dir or Path(os.environ.get("ADIBUILD_VIVADO_DEBUG_DIR", ""))
             if os.environ.get("ADIBUILD_VIVADO_DEBUG_DIR")
-            else Path.home() / ".adibuild" / "toolchains" / "vivado" / "debug"
+            else adibuild_home() / "toolchains" / "vivado" / "debug"
         )
 
     def _take_screenshot(self, driver, name: str) -> None:
@@ -1072,7 +1073,7 @@ class PlaywrightDownloadStrategy:
         self.screenshot_dir = (
             screenshot_dir or Path(os.environ.get("ADIBUILD_VIVADO_DEBUG_DIR", ""))
             if os.environ.get("ADIBUILD_VIVADO_DEBUG_DIR")
-            else Path.home() / ".adibuild" / "toolchains" / "vivado" / "debug"
+            else adibuild_home() / "toolchains" / "vivado" / "debug"
         )
 
     def _take_screenshot(self, page, name: str) -> None:
@@ -1695,7 +1696,7 @@ class VivadoInstaller:
         cache_dir: Path | None = None,
         release_catalog: dict[str, VivadoRelease] | None = None,
     ):
-        self.cache_dir = cache_dir or Path.home() / ".adibuild" / "toolchains" / "vivado"
+        self.cache_dir = cache_dir or adibuild_home() / "toolchains" / "vivado"
         self.release_catalog = release_catalog or SUPPORTED_RELEASES
         self.logger = get_logger("adibuild.vivado")
 
@@ -9,6 +9,7 @@ from adibuild.core.config import BuildConfig
 from adibuild.core.executor import BuildError
 from adibuild.platforms.base import Platform
 from adibuild.utils.git import GitRepository
+from adibuild.utils.paths import adibuild_home
 
 #: Default upstream repository URL.
 DEFAULT_REPO_URL = "https://github.com/analogdevicesinc/arm-trusted-firmware.git"
@@ -53,7 +54,7 @@ class ATFBuilder(BuilderBase):
         repo_url = self.config.get_repository() or DEFAULT_REPO_URL
         tag = self.config.get_tag() or "master"
 
-        repo_cache = Path.home() / ".adibuild" / "repos" / REPO_CACHE_NAME
+        repo_cache = adibuild_home() / "repos" / REPO_CACHE_NAME
         self.source_dir = repo_cache
 
         self.repo = GitRepository(
@@ -11,6 +11,7 @@ from adibuild.core.config import BuildConfig
 from adibuild.core.executor import BuildError
 from adibuild.platforms.base import Platform
 from adibuild.utils.git import GitRepository
+from adibuild.utils.paths import adibuild_home
 
 
 class HDLBuilder(BuilderBase):
@@ -61,7 +62,7 @@ class HDLBuilder(BuilderBase):
 
         # Setup repository path
         # Use a separate cache for hdl repo
-        repo_cache = Path.home() / ".adibuild" / "repos" / "hdl"
+        repo_cache = adibuild_home() / "repos" / "hdl"
         self.source_dir = repo_cache
 
         # Initialize git repository
@@ -153,7 +154,7 @@ class HDLBuilder(BuilderBase):
                 power_report=power_report,
                 utilization_report=utilization_report,
             )
-            cache_base = Path.home() / ".adibuild" / "cache" / "hdl"
+            cache_base = adibuild_home() / "cache" / "hdl"
             cache_dir = cache_base / cache_key
 
             if cache_dir.exists():
@@ -244,9 +245,7 @@ class HDLBuilder(BuilderBase):
             env["ADI_GENERATE_UTILIZATION"] = "1"
 
         # Helper to format make args
-        make_args = ["-C", str(project_dir)]
-        for k, v in make_vars.items():
-            make_args.append(f"{k}={v}")
+        make_args = ["-C", str(project_dir), *(f"{k}={v}" for k, v in make_vars.items())]
 
         # Execute build
         if self._is_windows():
@@ -11,6 +11,7 @@ from adibuild.core.executor import BuildError
 from adibuild.platforms.base import Platform
 from adibuild.platforms.lib import LibPlatform
 from adibuild.utils.git import GitRepository
+from adibuild.utils.paths import adibuild_home
 
 #: Default upstream repository URL.
 DEFAULT_REPO_URL = "https://github.com/analogdevicesinc/iio-oscilloscope.git"
@@ -74,7 +75,7 @@ class IIOOscilloscopeBuilder(BuilderBase):
         repo_url = self.config.get_repository() or DEFAULT_REPO_URL
         tag = self.config.get_tag()
 
-        repo_cache = Path.home() / ".adibuild" / "repos" / REPO_CACHE_NAME
+        repo_cache = adibuild_home() / "repos" / REPO_CACHE_NAME
         self.source_dir = repo_cache
 
         self.repo = GitRepository(
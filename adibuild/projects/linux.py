@@ -11,6 +11,7 @@ from adibuild.core.config import BuildConfig
 from adibuild.core.executor import BuildError
 from adibuild.platforms.base import Platform
 from adibuild.utils.git import GitRepository
+from adibuild.utils.paths import adibuild_home
 
 
 class LinuxBuilder(BuilderBase):
@@ -57,7 +58,7 @@ class LinuxBuilder(BuilderBase):
         tag = self.config.get_tag()
 
         # Setup repository path
-        repo_cache = Path.home() / ".adibuild" / "repos" / "linux"
+        repo_cache = adibuild_home() / "repos" / "linux"
         self.source_dir = repo_cache
 
         # Initialize git repository
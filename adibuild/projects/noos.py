@@ -9,6 +9,7 @@ from adibuild.core.config import BuildConfig
 from adibuild.core.executor import BuildError
 from adibuild.platforms.base import Platform
 from adibuild.utils.git import GitRepository
+from adibuild.utils.paths import adibuild_home
 
 
 class NoOSBuilder(BuilderBase):
@@ -57,7 +58,7 @@ class NoOSBuilder(BuilderBase):
         tag = self.config.get_tag()
 
         # Cache no-OS repo at ~/.adibuild/repos/noos/
-        repo_cache = Path.home() / ".adibuild" / "repos" / "noos"
+        repo_cache = adibuild_home() / "repos" / "noos"
         self.source_dir = repo_cache
 
         self.repo = GitRepository(
@@ -2,10 +2,12 @@
 
 from adibuild.utils.git import GitRepository
 from adibuild.utils.logger import get_logger, setup_logging
+from adibuild.utils.paths import adibuild_home
 from adibuild.utils.validators import validate_path, validate_platform, validate_tag
 
 __all__ = [
     "GitRepository",
+    "adibuild_home",
     "get_logger",
     "setup_logging",
     "validate_platform",
@@ -7,6 +7,7 @@ from typing import Any
 import git
 
 from adibuild.utils.logger import get_logger
+from adibuild.utils.paths import adibuild_home
 
 # Import ScriptBuilder type only for type checking to avoid circular imports if possible
 # But actually we can just use duck typing or import inside methods if needed.
@@ -43,7 +44,7 @@ class GitRepository:
         """
         self.url = url
         self.local_path = Path(local_path)
-        self.cache_dir = cache_dir or Path.home() / ".adibuild" / "repos"
+        self.cache_dir = cache_dir or adibuild_home() / "repos"
         self.logger = get_logger("adibuild.git")
         self.repo: git.Repo | None = None
         self.script_builder = script_builder
@@ -0,0 +1,21 @@
+"""Filesystem locations used by adibuild."""
+
+from pathlib import Path
+
+
+def _home() -> Path:
+    """Return the user's home directory."""
+    return Path.home()
+
+
+def adibuild_home() -> Path:
+    """
+    Return the adibuild state directory (~/.adibuild).
+
+    Repository caches, toolchains, build caches, work directories and the user
+    configuration all live below this directory.
+
+    Returns:
+        Path to the adibuild state directory
+    """
+    return _home() / ".adibuild"
@@ -79,6 +79,10 @@ def tests(session):
     session.run(
         "pytest",
         "-v",
+        "-n",
+        "auto",
+        "--dist",
+        "loadfile",
         "--cov=adibuild",
         "--cov-report=term-missing",
         "--cov-report=html",
@@ -4,7 +4,11 @@ import json
 import os
 from pprint import pprint
 
-from gen_kuiper_reference import clone_repo, parse_dts_for_hdl_info
+from gen_kuiper_reference import (
+    LINUX_SPARSE_PATHS,
+    clone_repo,
+    parse_dts_for_hdl_info,
+)
 
 
 def find_hdl_parameters(dts_path):
@@ -35,7 +39,12 @@ def parse_fabric_designs(release):
     linux_source_dir = "linux"
     if release == "2023_R2_P1":
         release = "2023_R2"
-    clone_repo("https://github.com/analogdevicesinc/linux.git", release, linux_source_dir)
+    clone_repo(
+        "https://github.com/analogdevicesinc/linux.git",
+        release,
+        linux_source_dir,
+        sparse_paths=LINUX_SPARSE_PATHS,
+    )
 
     # Parse ADI devicetrees that are in the repo
     # Search within the arch/microblaze/boot/dts directory for files that match the pattern ad9361-*.dts
@@ -43,35 +52,36 @@ def parse_fabric_designs(release):
     project_map = {}
     dts_dir = os.path.join(linux_source_dir, "arch/microblaze/boot/dts")
     carriers = ["vcu118", "kcu105"]
+    # Walk the tree once and match every carrier against the same listing
+    dts_files = [
+        (file, os.path.join(root, file))
+        for root, dirs, files in os.walk(dts_dir)
+        for file in files
+        if file.endswith(".dts")
+    ]
     for carrier in carriers:
-        for root, dirs, files in os.walk(dts_dir):
-            for file in files:
-                if carrier in file and file.endswith(".dts"):
-                    full_path = os.path.join(root, file)
-                    print(f"Found fabric design: {file}")
-                    print(f"Path: {full_path}")
-                else:
-                    continue
-                with open(full_path) as f:
-                    content = f.read()
-                lines = content.splitlines()
-                for line in lines:
-                    if "hdl_project" in line:
-                        project, fpga = parse_dts_for_hdl_info(full_path)
-                        print(f"Project: {project}, Carrier: {fpga}")
-                        if project:
-                            # relative path from the root of the repo
-                            dts_path = os.path.relpath(full_path, linux_source_dir)
-                            if project not in project_map:
-                                project_map[project] = []
-                            project_map[project].append(
-                                {
-                                    "carrier": fpga,
-                                    "dts_path": dts_path,
-                                    "hdl_parameters": find_hdl_parameters(full_path),
-                                }
-                            )
-                        break
+        for file, full_path in dts_files:
+            if carrier not in file:
+                continue
+            print(f"Found fabric design: {file}")
+            print(f"Path: {full_path}")
+            project, fpga = parse_dts_for_hdl_info(full_path)
+            if project is None:
+                # No hdl_project line in this devicetree
+                continue
+            print(f"Project: {project}, Carrier: {fpga}")
+            if project:
+                # relative path from the root of the repo
+                dts_path = os.path.relpath(full_path, linux_source_dir)
+                if project not in project_map:
+                    project_map[project] = []
+                project_map[project].append(
+                    {
+                        "carrier": fpga,
+                        "dts_path": dts_path,
+                        "hdl_parameters": find_hdl_parameters(full_path),
+                    }
+                )
 
     print("\nSummary of fabric designs:")
     pprint(project_map)
@@ -2,12 +2,17 @@ import hashlib
 import json
 import logging
 import lzma
+import mmap
 import os
 import pathlib
 import shutil
 import subprocess
+import tempfile
+import threading
 import time
 import zipfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from difflib import SequenceMatcher
 from pprint import pprint
 
@@ -17,11 +22,33 @@ from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.util.retry import Retry
 from tqdm import tqdm
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    process = None
+
 logger = logging.getLogger(__name__)
 
 # Show only errors
 logger.setLevel(logging.ERROR)
 
+# Bytes to accumulate before refreshing a progress bar
+PROGRESS_BATCH = 8 << 20
+
+# Bytes requested per read while streaming a download
+DOWNLOAD_BLOCK_SIZE = 1 << 20
+
+# Parts of the source trees that get parsed, everything else is left unfetched
+LINUX_SPARSE_PATHS = [
+    "arch/arm/boot/dts",
+    "arch/arm64/boot/dts",
+    "arch/microblaze/boot/dts",
+]
+HDL_SPARSE_PATHS = ["projects"]
+
+# Smaller files are read outright, mapping them costs more than it saves
+MMAP_MIN_SIZE = 4096
+
 
 # Custom Exception
 class NoDTSFoundError(Exception):
@@ -48,34 +75,38 @@ class Downloader:
         >>> dl.download(rel["link"], rel["zipname"])
         >>> dl.check(rel["zipname"], rel["zipmd5"])
         >>> dl.extract(rel["zipname"], rel["imgname"])
+
+    Args:
+        hashes_log_path (str, optional): File that SHA-256 hashes of downloads
+            are appended to. Defaults to hashes.txt next to the first
+            downloaded file.
     """
 
+    def __init__(self, hashes_log_path=None):
+        self.hashes_log_path = hashes_log_path
+        self._hashes_log = None
+
     def releases(self, release="2019_R1"):
         rel = {}
         valid_releases = ["2018_R2", "2019_R1", "2023_R2_P1"]
         if release == "2018_R2":
             rel["imgname"] = "2018_R2-2019_05_23.img"
             rel["xzmd5"] = "c377ca95209f0f3d6901fd38ef2b4dfd"
-            rel["imgmd5"] = "59c2fe68118c3b635617e36632f5db0b"
         elif release == "2019_R1":
             rel["imgname"] = "2019_R1-2020_02_04.img"
             rel["xzmd5"] = "49c121d5e7072ab84760fed78812999f"
-            rel["imgmd5"] = "40aa0cd80144a205fc018f479eff5fce"
         elif release == "2022_R2":
             rel["imgname"] = "image_2023-12-13-ADI-Kuiper-full"
             rel["zipmd5"] = "9dfd5d57573e14e06715a08b19a6a26a"
-            rel["imgmd5"] = "e3620b6d36ad0481b79eee6041769f38"
         elif release == "2023_R2":
             # https://swdownloads.analog.com/cse/kuiper/image_2024-11-08-ADI-Kuiper-full.zip
             rel["imgname"] = "image_2024-11-08-ADI-Kuiper-full"
             rel["zipmd5"] = "338f747964283b518c6492addca90ad5"
-            rel["imgmd5"] = "7764911b0b0da4a022706418a012c411"
         elif release == "2023_R2_P1":
             # https://swdownloads.analog.com/cse/kuiper/image_2025-03-18-ADI-Kuiper-full.zip
             rel["imgname"] = "image_2025-03-18-ADI-Kuiper-full"
             # rel["imgname"] = "2023_R2_P1-2025_03_18.img"
             rel["zipmd5"] = "6c92259dd61520d08244012f6c92d7c6"
-            rel["imgmd5"] = "873b4977617e40725025aa4958f3ca7e"
         else:
             raise Exception(
                 f"Unknown release version {release}. Valid releases: {valid_releases}"
@@ -117,39 +148,44 @@ class Downloader:
         total = int(resp.headers.get("content-length", 0))
         sha256_hash = hashlib.sha256()
         with (
-            open(fname, "wb") as file,
+            open(fname, "wb", buffering=4 << 20) as file,
             tqdm(
                 desc=fname,
                 total=total,
                 unit="iB",
                 unit_scale=True,
                 unit_divisor=1024,
+                mininterval=0.5,
             ) as bar,
         ):
-            for data in resp.iter_content(chunk_size=1024):
-                size = file.write(data)
+            pending = 0
+            for data in resp.iter_content(chunk_size=DOWNLOAD_BLOCK_SIZE):
+                pending += file.write(data)
                 sha256_hash.update(data)
-                bar.update(size)
+                if pending >= PROGRESS_BATCH:
+                    bar.update(pending)
+                    pending = 0
+            bar.update(pending)
         hash = sha256_hash.hexdigest()
-        with open(os.path.join(os.path.dirname(fname), "hashes.txt"), "a") as h:
-            h.write(f"{os.path.basename(fname)},{hash}\n")
+        if self._hashes_log is None:
+            if self.hashes_log_path is None:
+                self.hashes_log_path = os.path.join(
+                    os.path.dirname(os.path.abspath(fname)), "hashes.txt"
+                )
+            self._hashes_log = open(self.hashes_log_path, "a")
+        self._hashes_log.write(f"{os.path.basename(fname)},{hash}\n")
+        self._hashes_log.flush()
+
+    def close(self):
+        """Close the hashes log if it was opened."""
+        if self._hashes_log is not None:
+            self._hashes_log.close()
+            self._hashes_log = None
 
-    def check(self, fname, ref, find_img=False):
+    def check(self, fname, ref):
         print("Checking " + fname + " against reference MD5: " + ref)
         hash_md5 = hashlib.md5()
-        if find_img and not os.path.isfile(fname):
-            # Search for img file in same directory
-            dirpath = os.path.abspath(fname)
-            # dirpath = os.path.dirname(fname)
-            for file in os.listdir(dirpath):
-                if file.endswith(".img"):
-                    fname = os.path.join(dirpath, file)
-                    print(f"Found image file {fname} for MD5 check")
-                    break
-            if not os.path.isfile(fname):
-                raise Exception("No image file found for MD5 check")
-        else:
-            print("Using file " + fname + " for MD5 check")
+        print("Using file " + fname + " for MD5 check")
         tlfile = pathlib.Path(fname)
         total = os.path.getsize(tlfile)
         with (
@@ -162,10 +198,14 @@ class Downloader:
                 unit_divisor=1024,
             ) as bar,
         ):
+            pending = 0
             for chunk in iter(lambda: f.read(4096), b""):
                 hash_md5.update(chunk)
-                size = len(chunk)
-                bar.update(size)
+                pending += len(chunk)
+                if pending >= PROGRESS_BATCH:
+                    bar.update(pending)
+                    pending = 0
+            bar.update(pending)
         h = hash_md5.hexdigest()
         if h == ref:
             print("MD5 Check: PASSED")
@@ -176,42 +216,72 @@ class Downloader:
         return fname
 
     def extract(self, inname, outname):
+        """Extract an archive and return the path of the extracted .img file."""
         print("Extracting " + inname + " to " + outname)
         if inname.endswith(".xz"):
-            self.extract_xz(inname, outname)
+            return self.extract_xz(inname, outname)
         elif inname.endswith(".zip"):
-            self.extract_zip(inname, outname)
+            return self.extract_zip(inname, outname)
         else:
             raise Exception("Unknown compression format for " + inname)
 
     def extract_xz(self, inname, outname):
-        tlfile = pathlib.Path(inname)
+        # The xz binary decompresses multi-threaded, prefer it when available
+        if shutil.which("xz"):
+            with open(outname, "wb") as file:
+                subprocess.run(["xz", "-d", "-c", "-T0", inname], stdout=file, check=True)
+            return outname
 
-        decompressor = lzma.LZMADecompressor()
-        with open(tlfile, "rb") as ifile:
-            total = 0
-            with (
-                open(outname, "wb") as file,
-                tqdm(
-                    desc="Decompressing: " + outname,
-                    total=total,
-                    unit="iB",
-                    unit_scale=True,
-                    unit_divisor=1024,
-                ) as bar,
-            ):
-                data = ifile.read(1024)
-                while data:
-                    result = decompressor.decompress(data)
-                    if result != b"":
-                        size = file.write(result)
-                        bar.update(size)
-                    data = ifile.read(1024)
+        tlfile = pathlib.Path(inname)
+        total = os.path.getsize(tlfile)
+        with (
+            open(tlfile, "rb") as rawfile,
+            lzma.open(rawfile, "rb") as ifile,
+            open(outname, "wb") as file,
+            tqdm(
+                desc="Decompressing: " + outname,
+                total=total,
+                unit="iB",
+                unit_scale=True,
+                unit_divisor=1024,
+            ) as bar,
+        ):
+            # Progress is tracked against the compressed input
+            for data in iter(lambda: ifile.read(1 << 20), b""):
+                file.write(data)
+                if rawfile.tell() - bar.n >= PROGRESS_BATCH:
+                    bar.update(rawfile.tell() - bar.n)
+            bar.update(rawfile.tell() - bar.n)
+        return outname
 
     def extract_zip(self, inname, outdir):
         tlfile = pathlib.Path(inname)
         with zipfile.ZipFile(tlfile, "r") as zip_ref:
-            zip_ref.extractall(outdir)
+            img_names = [n for n in zip_ref.namelist() if n.endswith(".img")]
+        if not img_names:
+            raise Exception("No image file found in " + inname)
+        img_file = os.path.join(outdir, img_names[0])
+
+        if shutil.which("unzip"):
+            subprocess.run(["unzip", "-o", "-q", inname, "-d", outdir], check=True)
+            return img_file
+
+        outdir = os.path.abspath(outdir)
+        with zipfile.ZipFile(tlfile, "r") as zip_ref:
+            for info in zip_ref.infolist():
+                target = os.path.abspath(os.path.join(outdir, info.filename))
+                if os.path.commonpath([outdir, target]) != outdir:
+                    raise Exception(
+                        f"Refusing to extract {info.filename} outside {outdir}"
+                    )
+                if info.is_dir():
+                    os.makedirs(target, exist_ok=True)
+                    continue
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                # extractall copies members with an 8 KiB buffer, use 4 MiB instead
+                with zip_ref.open(info) as src, open(target, "wb") as dst:
+                    shutil.copyfileobj(src, dst, length=4 << 20)
+        return img_file
 
 
 class KuiperDLDriver:
@@ -227,6 +297,10 @@ class KuiperDLDriver:
 
     release_version = "2023_R2_P1"
 
+    # In-memory copy of cache_info.json shared by all drivers, loaded on first use
+    _cache = None
+    _cache_lock = threading.Lock()
+
     def __init__(self, release_version=None, output_dir=None):
         self.release_version = release_version
         self.output_dir = output_dir
@@ -235,6 +309,30 @@ class KuiperDLDriver:
         # self.logger.setLevel(logging.DEBUG)
         self.logger.addHandler(logging.StreamHandler())
 
+    def _load_cache(self):
+        """Return the cache data, reading cache_info.json only on first use."""
+        with self._cache_lock:
+            if KuiperDLDriver._cache is None:
+                cache_file_path = os.path.join(self.cache_path, self.cache_datafile)
+                cache_data = {}
+                if os.path.exists(cache_file_path):
+                    with open(cache_file_path) as f:
+                        cache_data = json.load(f)
+                KuiperDLDriver._cache = cache_data
+            return KuiperDLDriver._cache
+
+    def _update_cache(self, release_version, release_info):
+        """Record a cached release and atomically rewrite cache_info.json."""
+        cache_data = self._load_cache()
+        cache_file_path = os.path.join(self.cache_path, self.cache_datafile)
+        with self._cache_lock:
+            cache_data[release_version] = release_info
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.cache_path, suffix=".tmp", delete=False
+            ) as f:
+                json.dump(cache_data, f, indent=4)
+            os.replace(f.name, cache_file_path)
+
     def check_cached(self, release_version=None):
         """Check if the specified Kuiper release version is cached locally.
         Args:
@@ -244,27 +342,14 @@ class KuiperDLDriver:
             bool: True if the release is cached, False otherwise.
         """
         cache_path = self.cache_path
-        if not os.path.exists(cache_path):
-            os.makedirs(cache_path)
-
-        cache_file_path = os.path.join(cache_path, self.cache_datafile)
-        if not os.path.exists(cache_file_path):
-            return False
+        os.makedirs(cache_path, exist_ok=True)
 
         if release_version is None:
             release_version = self.release_version
 
-        # Read cache file and check version
-        with open(cache_file_path) as f:
-            cache_data = json.load(f)
-
-        for release in cache_data:
-            if release == release_version:
-                # Verify that the tarball path exists
-                image_path = cache_data[release]["image_path"]
-                if os.path.exists(image_path):
-                    return True
-        return False
+        release_info = self._load_cache().get(release_version)
+        # Verify that the image path exists
+        return release_info is not None and os.path.exists(release_info["image_path"])
 
     def download_release(self, release_version=None, get_boot_files=False):
         """Download the specified Kuiper release version if not already cached.
@@ -285,23 +370,23 @@ class KuiperDLDriver:
             )
 
             cache_path = self.cache_path
-            if not os.path.exists(cache_path):
-                os.makedirs(cache_path)
+            os.makedirs(cache_path, exist_ok=True)
 
             tarball_path = os.path.join(
                 cache_path, f"{release_version}_boot_partition.tar.gz"
             )
             raise NotImplementedError("Boot files download not implemented yet.")
         else:
-            downloader = Downloader()
+            cache_path = self.cache_path
+            os.makedirs(cache_path, exist_ok=True)
+
+            downloader = Downloader(
+                hashes_log_path=os.path.join(cache_path, "hashes.txt")
+            )
             rel_info = downloader.releases(release_version)
             url = rel_info["link"]
             self.logger.info(f"Downloading Kuiper release {release_version} from {url}")
 
-            cache_path = self.cache_path
-            if not os.path.exists(cache_path):
-                os.makedirs(cache_path)
-
             if "xzname" in rel_info:
                 tarball_path = os.path.join(cache_path, rel_info["xzname"])
             elif "zipname" in rel_info:
@@ -313,12 +398,14 @@ class KuiperDLDriver:
                 rel_info["xzname"] if "xzname" in rel_info else rel_info["zipname"]
             )
             md5_archive = rel_info["xzmd5"] if "xzmd5" in rel_info else rel_info["zipmd5"]
-            downloader.download(rel_info["link"], name_archive)
+            try:
+                downloader.download(rel_info["link"], name_archive)
+            finally:
+                downloader.close()
             downloader.check(name_archive, md5_archive)
-            downloader.extract(name_archive, rel_info["imgname"])
-            img_file = downloader.check(
-                rel_info["imgname"], rel_info["imgmd5"], find_img=True
-            )
+            # The archive MD5 was verified above and both xz and zip carry their
+            # own integrity checks, so the extracted image is not hashed again
+            img_file = downloader.extract(name_archive, rel_info["imgname"])
 
             # Move img file to cache path
             self.logger.info(
@@ -326,7 +413,7 @@ class KuiperDLDriver:
             )
             img_filename = os.path.basename(img_file)
             target_path = os.path.join(cache_path, img_filename)
-            shutil.move(img_file, target_path)
+            move_file(img_file, target_path)
 
             # Cleanup
             self.logger.info("Cleaning up temporary files")
@@ -339,21 +426,15 @@ class KuiperDLDriver:
                 os.rmdir(rel_info["imgname"])
 
         # Update cache info
-        cache_file_path = os.path.join(cache_path, self.cache_datafile)
-        cache_data = {}
-        if os.path.exists(cache_file_path):
-            with open(cache_file_path) as f:
-                cache_data = json.load(f)
-
-        cache_data[release_version] = {
-            # "tarball_path": tarball_path,
-            "image_path": target_path,
-            "download_time": time.ctime(),
-            "download_date": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
-        }
-
-        with open(cache_file_path, "w") as f:
-            json.dump(cache_data, f, indent=4)
+        self._update_cache(
+            release_version,
+            {
+                # "tarball_path": tarball_path,
+                "image_path": target_path,
+                "download_time": time.ctime(),
+                "download_date": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime()),
+            },
+        )
 
         self.logger.info(f"Kuiper release {release_version} cached successfully.")
 
@@ -368,43 +449,74 @@ class KuiperDLDriver:
         if not self.check_cached():
             self.download_release(get_boot_files=False)
 
-        with open(os.path.join(self.cache_path, self.cache_datafile)) as f:
-            cache_data = json.load(f)
-        release_info = cache_data[self.release_version]
+        release_info = self._load_cache()[self.release_version]
 
         img = IMGFileExtractor(release_info["image_path"], logger=self.logger)
-        for i, part in enumerate(img.get_partitions()):
-            self.logger.debug(
-                f"  {i}: {part['description']} - Offset: {part['start']} bytes"
-            )
+        try:
+            for i, part in enumerate(img.get_partitions()):
+                self.logger.debug(
+                    f"  {i}: {part['description']} - Offset: {part['start']} bytes"
+                )
 
-        # List files in FAT partition
-        partitions_info = img.get_partitions()
-        fat_partition = None
-        for part in partitions_info:
-            if "FAT" in part["description"]:
-                fat_partition = part
-                break
-        if fat_partition is None:
-            raise Exception("No FAT partition found in Kuiper image")
+            # List files in FAT partition
+            partitions_info = img.get_partitions()
+            fat_partition = None
+            for part in partitions_info:
+                if "FAT" in part["description"]:
+                    fat_partition = part
+                    break
+            if fat_partition is None:
+                raise Exception("No FAT partition found in Kuiper image")
 
-        fs = img.open_filesystem(fat_partition["start"])
-        files = img.list_files(fs, "/")
-        files_str = ""
-        for f in files:
-            files_str += f"{f['type']}: {f['path']} ({f['size']} bytes)\n"
+            fs = img.open_filesystem(fat_partition["start"])
+            files = img.list_files(fs, "/")
+            files_str = ""
+            for f in files:
+                files_str += f"{f['type']}: {f['path']} ({f['size']} bytes)\n"
+        finally:
+            img.close()
 
         if get_all_files:
             return files
 
 
-def clone_repo(repo_url, branch, dest_dir):
+def move_file(src, dst):
+    """Move a file, copying in the kernel when crossing filesystems.
+
+    Args:
+        src (str): Path of the file to move.
+        dst (str): Destination file path.
+    """
+    try:
+        # Same filesystem, no data is moved
+        os.rename(src, dst)
+        return
+    except OSError:
+        pass
+    if not hasattr(os, "copy_file_range"):
+        shutil.move(src, dst)
+        return
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                pass
+    except OSError:
+        # Filesystem pair does not support copy_file_range
+        shutil.move(src, dst)
+        return
+    shutil.copystat(src, dst)
+    os.unlink(src)
+
+
+def clone_repo(repo_url, branch, dest_dir, sparse_paths=None):
     """Clone a git repository to a destination directory.
 
     Args:
         repo_url (str): URL of the git repository.
         branch (str): Branch to clone.
         dest_dir (str): Destination directory.
+        sparse_paths (list, optional): Only check out these directories. Blobs
+            outside them are never downloaded. Requires git 2.25 or newer.
     """
     # Use subprocess to clone the repository
     print(f"Cloning {repo_url} branch {branch} to {dest_dir}")
@@ -417,27 +529,92 @@ def clone_repo(repo_url, branch, dest_dir):
         current_branch = output.decode("utf-8").strip()
         if current_branch != branch:
             print(f"Changing branch from {current_branch} to {branch}")
-            subprocess.run(["git", "checkout", branch], cwd=dest_dir, check=True)
+            # Clones are shallow and single-branch, so fetch only the tip of the
+            # requested branch before switching to it
+            subprocess.run(
+                ["git", "fetch", "--depth", "1", "origin", branch],
+                cwd=dest_dir,
+                check=True,
+            )
+            subprocess.run(
+                ["git", "checkout", "-B", branch, "FETCH_HEAD"], cwd=dest_dir, check=True
+            )
             # raise Exception(f"Branch of the repository is {current_branch}, expected {branch}. Skipping clone.")
         return
-    # subprocess.run(["git", "clone", "--depth", "1", "--branch", branch, repo_url, dest_dir], check=True)
-    subprocess.run(["git", "clone", "--branch", branch, repo_url, dest_dir], check=True)
+    cmd = ["git", "clone", "--depth", "1", "--single-branch", "--branch", branch]
+    if sparse_paths:
+        cmd += ["--filter=blob:none", "--sparse"]
+    subprocess.run([*cmd, repo_url, dest_dir], check=True)
+    if sparse_paths:
+        subprocess.run(
+            ["git", "sparse-checkout", "set", *sparse_paths], cwd=dest_dir, check=True
+        )
+
+
+def best_fuzzy_match(name, choices, score_required):
+    """Return the choice most similar to name, or None if below score_required.
+
+    Uses rapidfuzz when installed and falls back to difflib otherwise.
+
+    Args:
+        name (str): String to match.
+        choices (list): Candidate strings.
+        score_required (float): Minimum similarity ratio between 0 and 1.
+    """
+    if process is not None:
+        match = process.extractOne(
+            name, choices, scorer=fuzz.ratio, score_cutoff=score_required * 100
+        )
+        return match[0] if match else None
+
+    best = None
+    best_score = 0.0
+    for choice in choices:
+        score = SequenceMatcher(None, name, choice).ratio()
+        if score >= score_required and score > best_score:
+            best, best_score = choice, score
+    return best
+
+
+def find_dts_line(devicetree_file, needle):
+    """Return the first line of a devicetree file containing needle, or None.
+
+    Files larger than a page are memory-mapped and searched as bytes so only the
+    matching line is decoded.
+
+    Args:
+        devicetree_file (str): Path to the devicetree source.
+        needle (bytes): Byte string to search for.
+    """
+    with open(devicetree_file, "rb") as f:
+        if os.fstat(f.fileno()).st_size <= MMAP_MIN_SIZE:
+            content = f.read()
+        else:
+            content = mmap.mmap(f.fileno(), 0, prot=mmap.PROT_READ)
+        try:
+            pos = content.find(needle)
+            if pos < 0:
+                return None
+            start = content.rfind(b"\n", 0, pos) + 1
+            end = content.find(b"\n", pos)
+            return content[start : end if end >= 0 else len(content)].decode()
+        finally:
+            if isinstance(content, mmap.mmap):
+                content.close()
 
 
 def parse_dts_for_hdl_info(devicetree_file):
-    with open(devicetree_file) as f:
-        devicetree_content = f.read()
     # Look for line with hdl_project: <project/carrier> ex: <ad9081_fmca_ebz/zcu102>
-    for line in devicetree_content.split("\n"):
-        if "hdl_project" in line:
-            project_carrier = line.split(":")[1].strip()
-            project_carrier = project_carrier.replace("<", "").replace(">", "")
-            project = project_carrier.split("/")[0].strip()
-            if len(project_carrier.split("/")) != 2:
-                return project, None
-            carrier = project_carrier.split("/")[1].strip()
-            return project, carrier
-    return None, None
+    line = find_dts_line(devicetree_file, b"hdl_project")
+    if line is None:
+        return None, None
+    project_carrier = line.split(":")[1].strip()
+    project_carrier = project_carrier.replace("<", "").replace(">", "")
+    project = project_carrier.split("/")[0].strip()
+    if len(project_carrier.split("/")) != 2:
+        return project, None
+    carrier = project_carrier.split("/")[1].strip()
+    return project, carrier
 
 
 def parse_kuiper_release(
@@ -474,7 +651,10 @@ def parse_kuiper_release(
         raise Exception(f"Linux branch not found for release version {release_version}")
 
     clone_repo(
-        "https://github.com/analogdevicesinc/linux.git", linux_branch, linux_source_dir
+        "https://github.com/analogdevicesinc/linux.git",
+        linux_branch,
+        linux_source_dir,
+        sparse_paths=LINUX_SPARSE_PATHS,
     )
 
     # Map hdl branch to release version
@@ -487,111 +667,123 @@ def parse_kuiper_release(
     else:
         raise Exception(f"HDL branch not found for release version {release_version}")
 
-    clone_repo("https://github.com/analogdevicesinc/hdl.git", hdl_branch, hdl_source_dir)
+    clone_repo(
+        "https://github.com/analogdevicesinc/hdl.git",
+        hdl_branch,
+        hdl_source_dir,
+        sparse_paths=HDL_SPARSE_PATHS,
+    )
+
+    project_map = defaultdict(list)
 
-    project_map = {}
+    # Index every devicetree source once, keeping the first path seen per name
+    dts_index = {}
+    for root, dirs, dts_files in os.walk(linux_source_dir):
+        for dts_file in dts_files:
+            if dts_file.endswith(".dts"):
+                dts_index.setdefault(dts_file, os.path.join(root, dts_file))
+    dts_names = list(dts_index)
 
     def find_devicetree_file_in_kernel_source(
-        devicetree_filename, kernel_source_dir, fuzzy=False, score_required=0.7
+        devicetree_filename, fuzzy=False, score_required=0.7
     ):
         # Make sure devicetree_filename ends with .dts
         ext = devicetree_filename[-4:]
         if ext != ".dts":
             devicetree_filename += ".dts"
-        for root, dirs, files in os.walk(kernel_source_dir):
-            for file in files:
-                if file == devicetree_filename:
-                    return os.path.join(root, file)
+        if devicetree_filename in dts_index:
+            return dts_index[devicetree_filename]
         if fuzzy:
-            for root, dirs, files in os.walk(kernel_source_dir):
-                for file in files:
-                    if file.endswith(".dts"):
-                        score = SequenceMatcher(None, devicetree_filename, file).ratio()
-                        if score >= score_required:
-                            return os.path.join(root, file)
+            match = best_fuzzy_match(devicetree_filename, dts_names, score_required)
+            if match:
+                return dts_index[match]
         return None
 
-    # Handl all xilinx/amd designs
-    not_found = []
-    for file in files:
-        if "zynq" in file["path"] and file["type"] == "file":
-            filename = file["path"].split("/")[-1]
-            if filename[-4:] != ".dtb":
-                continue
-            slash_count = file["path"].count("/")
-            # if slash_count == 3:
-            #     devicetree_filename = file['path'].split("/")[2]
-            # else:
-            #     devicetree_filename = file['path'].split("/")[1]
-
+    def lookup_devicetree(file):
+        slash_count = file["path"].count("/")
+        # if slash_count == 3:
+        #     devicetree_filename = file['path'].split("/")[2]
+        # else:
+        #     devicetree_filename = file['path'].split("/")[1]
+
+        devicetree_filename = None
+        devicetree_file = None
+        for i in range(1, slash_count):
+            devicetree_filename = file["path"].split("/")[i]
+            devicetree_file = find_devicetree_file_in_kernel_source(devicetree_filename)
+            if devicetree_file:
+                break
+        if not devicetree_file:
+            # Try fuzzy find
             for i in range(1, slash_count):
                 devicetree_filename = file["path"].split("/")[i]
                 devicetree_file = find_devicetree_file_in_kernel_source(
-                    devicetree_filename, linux_source_dir
+                    devicetree_filename,
+                    fuzzy=True,
+                    score_required=score_required,
                 )
                 if devicetree_file:
                     break
-            if not devicetree_file:
-                # Try fuzzy find
-                for i in range(1, slash_count):
-                    devicetree_filename = file["path"].split("/")[i]
-                    devicetree_file = find_devicetree_file_in_kernel_source(
-                        devicetree_filename,
-                        linux_source_dir,
-                        fuzzy=True,
-                        score_required=score_required,
-                    )
-                    if devicetree_file:
-                        break
 
-            if devicetree_file:
-                logger.debug(f"Found {devicetree_filename}")
-                project, carrier = parse_dts_for_hdl_info(devicetree_file)
-                # Get devicetree file in reference to linux path
-                devicetree_file_from_linux = os.path.relpath(
-                    devicetree_file, linux_source_dir
-                )
-                kernel_common = (
-                    "zynqmp-common/Image"
-                    if "zynqmp" in devicetree_file_from_linux
-                    else "zynq-common/uImage"
-                )
-                hdl_project_folder = (
-                    f"{project}/{carrier}" if project and carrier else project
-                )
-                logger.debug(
-                    f"HDL Project: {hdl_project_folder} : {devicetree_file_from_linux}"
+        project, carrier = None, None
+        if devicetree_file:
+            project, carrier = parse_dts_for_hdl_info(devicetree_file)
+        return devicetree_filename, devicetree_file, project, carrier
+
+    # Handl all xilinx/amd designs
+    dtb_files = [
+        file
+        for file in files
+        if "zynq" in file["path"]
+        and file["type"] == "file"
+        and file["path"].split("/")[-1][-4:] == ".dtb"
+    ]
+    # Lookups only read the index so they can run concurrently, results are
+    # merged in order below
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(lookup_devicetree, dtb_files))
+
+    not_found = []
+    for file, (devicetree_filename, devicetree_file, project, carrier) in zip(
+        dtb_files, results, strict=True
+    ):
+        if devicetree_file:
+            logger.debug(f"Found {devicetree_filename}")
+            # Get devicetree file in reference to linux path
+            devicetree_file_from_linux = os.path.relpath(
+                devicetree_file, linux_source_dir
+            )
+            kernel_common = (
+                "zynqmp-common/Image"
+                if "zynqmp" in devicetree_file_from_linux
+                else "zynq-common/uImage"
+            )
+            hdl_project_folder = (
+                f"{project}/{carrier}" if project and carrier else project
+            )
+            logger.debug(
+                f"HDL Project: {hdl_project_folder} : {devicetree_file_from_linux}"
+            )
+            if project:
+                project_map[project].append(
+                    {
+                        "carrier": carrier,
+                        "devicetree": devicetree_file_from_linux,
+                        "kernel": kernel_common,
+                        "hdl_project": hdl_project_folder,
+                    }
                 )
-                if project:
-                    if project not in project_map:
-                        project_map[project] = [
-                            {
-                                "carrier": carrier,
-                                "devicetree": devicetree_file_from_linux,
-                                "kernel": kernel_common,
-                                "hdl_project": hdl_project_folder,
-                            }
-                        ]
-                    else:
-                        project_map[project].append(
-                            {
-                                "carrier": carrier,
-                                "devicetree": devicetree_file_from_linux,
-                                "kernel": kernel_common,
-                                "hdl_project": hdl_project_folder,
-                            }
-                        )
-                else:
-                    not_found.append(
-                        {"devicetree_filename": devicetree_filename, "path": file["path"]}
-                    )
-            if not devicetree_file:
+            else:
                 not_found.append(
                     {"devicetree_filename": devicetree_filename, "path": file["path"]}
                 )
-                raise NoDTSFoundError(
-                    f"Devicetree file {devicetree_filename} not found in kernel source directory {linux_source_dir}"
-                )
+        else:
+            not_found.append(
+                {"devicetree_filename": devicetree_filename, "path": file["path"]}
+            )
+            raise NoDTSFoundError(
+                f"Devicetree file {devicetree_filename} not found in kernel source directory {linux_source_dir}"
+            )
 
     # Check for duplicate devicetrees
     # all_dts = []
@@ -609,7 +801,7 @@ def parse_kuiper_release(
     #     raise Exception(f"Duplicate devicetrees found: {duplicates}")
 
     metadata = {
-        "project_map": project_map,
+        "project_map": dict(project_map),
         "release_version": release_version,
         "linux_branch": linux_branch,
         "hdl_branch": hdl_branch,
@@ -620,29 +812,71 @@ def parse_kuiper_release(
     return metadata, not_found
 
 
+def find_release_metadata(release_version, files, min_score=90, max_score=99):
+    """Find the tightest fuzz score that resolves every devicetree of a release.
+
+    Lowering the score can only add matches, so whether all devicetrees are
+    found is monotone in the score and the sweep can be bisected.
+
+    Args:
+        release_version (str): Version of the Kuiper release.
+        files (list): List of files in the Kuiper release.
+        min_score (int): Lowest fuzz score to try, in percent.
+        max_score (int): Highest fuzz score to try, in percent.
+    Returns:
+        dict: Metadata for the highest score with no missing devicetrees, or
+            the metadata from the last successful parse if none resolves all.
+    """
+    best = None
+    fallback = None
+    lo, hi = min_score, max_score
+    while lo <= hi:
+        mid = (lo + hi) // 2
+        fuzz_score = float(mid) / 100
+        print(f"\nParse release {release_version} with fuzz score {fuzz_score}")
+        try:
+            metadata, not_found = parse_kuiper_release(
+                release_version, files, score_required=fuzz_score
+            )
+        except NoDTSFoundError as e:
+            logger.error(e)
+            hi = mid - 1
+            continue
+        if not not_found:
+            # Everything resolves here, so look for a stricter score that still does
+            best = metadata
+            lo = mid + 1
+        else:
+            fallback = metadata
+            hi = mid - 1
+    return best if best is not None else fallback
+
+
 if __name__ == "__main__":
 
-    release_metadata = {}
-    for release in ["2022_R2", "2023_R2", "2023_R2_P1"]:
+    releases = ["2022_R2", "2023_R2", "2023_R2_P1"]
+
+    def get_release_files(release):
         kuiper_dl_driver = KuiperDLDriver(
             release_version=release,
             # output_dir="/tmp/kuiper_reference",
         )
-        files = kuiper_dl_driver.get_boot_files_from_release()
-        for fuzz_score in range(99, 89, -1):
-            fuzz_score = float(fuzz_score) / 100
-            print(f"\nParse release {release} with fuzz score {fuzz_score}")
-            try:
-                metadata, not_found = parse_kuiper_release(
-                    kuiper_dl_driver.release_version, files, score_required=fuzz_score
-                )
-                if not not_found:
-                    break
-            except NoDTSFoundError as e:
-                logger.error(e)
-                not_found = True
-                metadata = None
-        release_metadata[release] = metadata
+        return kuiper_dl_driver.get_boot_files_from_release()
+
+    # Downloads and extraction are independent per release so run them together.
+    # Parsing stays serial since every release checks out a branch in the same
+    # linux/hdl source trees.
+    release_files = {}
+    with ThreadPoolExecutor(max_workers=len(releases)) as executor:
+        futures = {
+            executor.submit(get_release_files, release): release for release in releases
+        }
+        for future in as_completed(futures):
+            release_files[futures[future]] = future.result()
+
+    release_metadata = {}
+    for release in releases:
+        release_metadata[release] = find_release_metadata(release, release_files[release])
         # break # Debug
 
     pprint(release_metadata)
@@ -1,7 +1,48 @@
+import mmap
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 import pytsk3
 
+# Bytes read from the image per write when extracting files
+CHUNK_SIZE = 4 * 1024 * 1024
+
+# Files copied concurrently with copy_file_range when extracting directories
+COPY_WORKERS = 4
+
+
+class MmapImgInfo(pytsk3.Img_Info):
+    """Img_Info backed by a read-only mmap of a regular image file.
+
+    TSK issues many small sector reads while walking metadata; serving them
+    from the mapping avoids a read() syscall for each one.
+    """
+
+    def __init__(self, img_path):
+        self.fd = os.open(img_path, os.O_RDONLY)
+        try:
+            self._mm = mmap.mmap(self.fd, 0, prot=mmap.PROT_READ)
+        except (OSError, ValueError):
+            os.close(self.fd)
+            raise
+        super().__init__(url="", type=pytsk3.TSK_IMG_TYPE_EXTERNAL)
+
+    def read(self, offset, size):
+        return self._mm[offset : offset + size]
+
+    def get_size(self):
+        return len(self._mm)
+
+    def advise(self, advice):
+        """Pass an access pattern hint for the mapping to the kernel"""
+        if hasattr(self._mm, "madvise"):
+            self._mm.madvise(advice)
+
+    def close(self):
+        if not self._mm.closed:
+            self._mm.close()
+            os.close(self.fd)
+
 
 class IMGFileExtractor:
     """Extract files from disk image (.img) files using pytsk3.
@@ -26,8 +67,24 @@ class IMGFileExtractor:
 
     def __init__(self, img_path, logger=None):
         self.img_path = img_path
-        self.img_handle = pytsk3.Img_Info(img_path)
         self.logger = logger
+        # Raw descriptor for kernel-side copies, None if the image is not mapped
+        self.img_fd = None
+        self.img_handle = None
+        if os.path.isfile(img_path):
+            try:
+                self.img_handle = MmapImgInfo(img_path)
+                self.img_fd = self.img_handle.fd
+            except (OSError, ValueError):
+                # e.g. empty or unmappable file, let TSK read it itself
+                pass
+        if self.img_handle is None:
+            self.img_handle = pytsk3.Img_Info(img_path)
+        # Metadata walks jump around the image
+        self._advise("MADV_RANDOM")
+        # Volume and filesystem metadata are parsed once and reused
+        self._partitions = None
+        self._fs_cache = {}
 
     def log(self, message):
         if self.logger:
@@ -37,6 +94,12 @@ class IMGFileExtractor:
 
     def get_partitions(self):
         """List all partitions in the IMG file"""
+        if self._partitions is None:
+            self._partitions = self._read_partitions()
+        return [dict(partition) for partition in self._partitions]
+
+    def _read_partitions(self):
+        """Parse the partition table with pytsk3.Volume_Info"""
         try:
             volume = pytsk3.Volume_Info(self.img_handle)
             partitions = []
@@ -67,85 +130,262 @@ class IMGFileExtractor:
 
     def open_filesystem(self, partition_offset):
         """Open filesystem at a specific partition offset"""
+        fs = self._fs_cache.get(partition_offset)
+        if fs is not None:
+            return fs
         try:
-            return pytsk3.FS_Info(self.img_handle, offset=partition_offset)
+            fs = pytsk3.FS_Info(self.img_handle, offset=partition_offset)
         except Exception as e:
             raise Exception(
                 f"Could not open filesystem at offset {partition_offset}: {e}"
             ) from e
+        self._fs_cache[partition_offset] = fs
+        return fs
+
+    def _partition_offset(self, fs):
+        """Return the byte offset fs was opened at, or None if unknown"""
+        # FS_Info does not expose its offset, look it up among our handles
+        for offset, cached in self._fs_cache.items():
+            if cached is fs:
+                return offset
+        return None
+
+    def _walk(self, directory, path):
+        """Yield (full_path, entry) for everything below an open directory.
+
+        Entries come out in depth-first preorder, the same order the recursive
+        listing produced, but from an explicit stack of directory iterators. The
+        . and .. entries and entries without metadata are skipped.
+        """
+        stack = [(path.rstrip("/") + "/", iter(directory))]
+        while stack:
+            prefix, entries = stack[-1]
+            entry = next(entries, None)
+            if entry is None:
+                stack.pop()
+                continue
+
+            name = entry.info.name.name.decode("utf-8")
+            if name in [".", ".."] or not entry.info.meta:
+                continue
+
+            full_path = prefix + name
+            yield full_path, entry
+
+            if entry.info.meta.type == pytsk3.TSK_FS_META_TYPE_DIR:
+                try:
+                    subdirectory = entry.as_directory()
+                except Exception as e:
+                    print(f"Error listing {full_path}: {e}")
+                    continue
+                stack.append((full_path + "/", iter(subdirectory)))
 
-    def list_files(self, fs, path="/"):
-        """Recursively list all files in a directory"""
+    def iter_files(self, fs, path="/"):
+        """Lazily yield every file and directory below path"""
         try:
             directory = fs.open_dir(path)
-            files = []
-
-            for entry in directory:
-                name = entry.info.name.name.decode("utf-8")
-
-                # Skip . and ..
-                if name in [".", ".."]:
-                    continue
+        except Exception as e:
+            print(f"Error listing {path}: {e}")
+            return
 
-                full_path = f"{path}/{name}".replace("//", "/")
+        for full_path, entry in self._walk(directory, path):
+            if entry.info.meta.type == pytsk3.TSK_FS_META_TYPE_DIR:
+                yield {"path": full_path, "type": "dir", "size": 0}
+            else:
+                yield {"path": full_path, "type": "file", "size": entry.info.meta.size}
 
-                # Check if it's a directory
-                if (
-                    entry.info.meta
-                    and entry.info.meta.type == pytsk3.TSK_FS_META_TYPE_DIR
-                ):
-                    files.append({"path": full_path, "type": "dir", "size": 0})
-                    # Recursively list subdirectory
-                    files.extend(self.list_files(fs, full_path))
-                elif entry.info.meta:
-                    files.append(
-                        {"path": full_path, "type": "file", "size": entry.info.meta.size}
-                    )
+    def list_files(self, fs, path="/"):
+        """Recursively list all files in a directory"""
+        return list(self.iter_files(fs, path))
+
+    def _advise(self, name):
+        """Apply the named madvise hint if the image is mapped and it exists here"""
+        advice = getattr(mmap, name, None)
+        if advice is not None and isinstance(self.img_handle, MmapImgInfo):
+            self.img_handle.advise(advice)
+
+    def _data_extents(self, file_entry, partition_offset):
+        """Map file contents to (image offset, file offset, length) extents.
+
+        Returns None when the contents are not plain non-resident data runs that
+        cover the whole file, e.g. resident, sparse or compressed data.
+        """
+        block_size = file_entry.info.fs_info.block_size
+        file_size = file_entry.info.meta.size
+        data_types = (
+            pytsk3.TSK_FS_ATTR_TYPE_DEFAULT,
+            pytsk3.TSK_FS_ATTR_TYPE_NTFS_DATA,
+        )
+
+        for attr in file_entry:
+            if attr.info.type not in data_types:
+                continue
+            if not attr.info.flags & pytsk3.TSK_FS_ATTR_NONRES:
+                return None
+
+            extents = []
+            covered = 0
+            for run in attr:
+                if run.flags != pytsk3.TSK_FS_ATTR_RUN_FLAG_NONE:
+                    return None
+                out_offset = run.offset * block_size
+                if out_offset != covered:
+                    return None
+                length = min(run.len * block_size, file_size - out_offset)
+                if length <= 0:
+                    break
+                extents.append(
+                    (partition_offset + run.addr * block_size, out_offset, length)
+                )
+                covered += length
+            return extents if covered == file_size else None
+        return None
+
+    def _copy_plan(self, file_entry, partition_offset):
+        """Return the extents to copy with os.copy_file_range, or None.
+
+        None means the fast path does not apply and the file has to be read
+        through pytsk3 instead.
+        """
+        if not hasattr(os, "copy_file_range") or partition_offset is None:
+            return None
+        if self.img_fd is None or not file_entry.info.meta.size:
+            return None
+        return self._data_extents(file_entry, partition_offset) or None
+
+    def _copy_to_file(self, extents, output_path, file_size):
+        """Copy extents from the image to output_path inside the kernel.
+
+        Only makes os calls, so it is safe to run off the main thread. Returns
+        False if the kernel refuses the copy.
+        """
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        with open(output_path, "wb", buffering=0) as f:
+            out_fd = f.fileno()
+            if hasattr(os, "posix_fallocate"):
+                os.posix_fallocate(out_fd, 0, file_size)
+            try:
+                for src_offset, out_offset, length in extents:
+                    while length:
+                        copied = os.copy_file_range(
+                            self.img_fd, out_fd, length, src_offset, out_offset
+                        )
+                        if not copied:
+                            raise OSError(f"Short copy at offset {out_offset}")
+                        src_offset += copied
+                        out_offset += copied
+                        length -= copied
+            except OSError as e:
+                # e.g. EXDEV on kernels that refuse cross-filesystem copies
+                self.log(f"copy_file_range failed, falling back to reads: {e}")
+                return False
+        return True
+
+    def _read_to_file(self, file_entry, output_path):
+        """Read an open file entry through pytsk3 and write it to output_path"""
+        file_size = file_entry.info.meta.size
+
+        # Create output directory if needed
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+        # Stream to output file in chunks to bound memory use
+        with open(output_path, "wb", buffering=0) as f:
+            if file_size and hasattr(os, "posix_fallocate"):
+                os.posix_fallocate(f.fileno(), 0, file_size)
+            offset = 0
+            while offset < file_size:
+                size = min(CHUNK_SIZE, file_size - offset)
+                data = file_entry.read_random(offset, size)
+                if not data:
+                    raise OSError(f"Short read at offset {offset}")
+                f.write(data)
+                offset += len(data)
 
-            return files
-        except Exception as e:
-            print(f"Error listing {path}: {e}")
-            return []
+    def _write_entry(self, file_entry, output_path, partition_offset=None):
+        """Write the contents of an open file entry to output_path"""
+        extents = self._copy_plan(file_entry, partition_offset)
+        if extents and self._copy_to_file(
+            extents, output_path, file_entry.info.meta.size
+        ):
+            return
+        self._read_to_file(file_entry, output_path)
 
     def extract_file(self, fs, file_path, output_path):
         """Extract a single file"""
         try:
             # Open the file in the filesystem
             file_entry = fs.open(file_path)
-
-            # Read file data
-            file_size = file_entry.info.meta.size
-            data = file_entry.read_random(0, file_size)
-
-            # Create output directory if needed
-            os.makedirs(os.path.dirname(output_path), exist_ok=True)
-
-            # Write to output file
-            with open(output_path, "wb") as f:
-                f.write(data)
+            self._advise("MADV_SEQUENTIAL")
+            self._write_entry(file_entry, output_path, self._partition_offset(fs))
 
             self.log(f"Extracted: {file_path} -> {output_path}")
             return True
         except Exception as e:
             self.log(f"Error extracting {file_path}: {e}")
             return False
+        finally:
+            self._advise("MADV_RANDOM")
+
+    def _walk_and_extract(self, directory, path, output_dir, partition_offset=None):
+        """Extract every file below an open directory"""
+        # Kernel-side copies release the GIL, so they overlap across files in a
+        # small pool; pytsk3 is only ever used from this thread
+        with ThreadPoolExecutor(max_workers=COPY_WORKERS) as pool:
+            copies = []
+            for full_path, entry in self._walk(directory, path):
+                # Skip directories and entries synthesized by TSK such as $OrphanFiles
+                if entry.info.meta.type in (
+                    pytsk3.TSK_FS_META_TYPE_DIR,
+                    pytsk3.TSK_FS_META_TYPE_VIRT,
+                    pytsk3.TSK_FS_META_TYPE_VIRT_DIR,
+                ):
+                    continue
+
+                # Read straight from the directory entry, no second path lookup
+                output_path = os.path.join(output_dir, full_path.lstrip("/"))
+                extents = self._copy_plan(entry, partition_offset)
+                if extents:
+                    future = pool.submit(
+                        self._copy_to_file, extents, output_path, entry.info.meta.size
+                    )
+                    copies.append((full_path, output_path, entry, future))
+                    continue
+                try:
+                    self._read_to_file(entry, output_path)
+                    self.log(f"Extracted: {full_path} -> {output_path}")
+                except Exception as e:
+                    self.log(f"Error extracting {full_path}: {e}")
+
+            for full_path, output_path, entry, future in copies:
+                try:
+                    if not future.result():
+                        self._read_to_file(entry, output_path)
+                    self.log(f"Extracted: {full_path} -> {output_path}")
+                except Exception as e:
+                    self.log(f"Error extracting {full_path}: {e}")
 
     def extract_directory(self, fs, source_path, output_dir):
         """Extract an entire directory recursively"""
-        files = self.list_files(fs, source_path)
-
-        for file_info in files:
-            if file_info["type"] == "file":
-                # Create relative path for output
-                rel_path = file_info["path"].lstrip("/")
-                output_path = os.path.join(output_dir, rel_path)
-                self.extract_file(fs, file_info["path"], output_path)
+        try:
+            directory = fs.open_dir(source_path)
+        except Exception as e:
+            print(f"Error listing {source_path}: {e}")
+            return
+        self._advise("MADV_SEQUENTIAL")
+        try:
+            self._walk_and_extract(
+                directory, source_path, output_dir, self._partition_offset(fs)
+            )
+        finally:
+            self._advise("MADV_RANDOM")
 
     def close(self):
         """Close the IMG file handle"""
-        # pytsk3.Img_Info doesn't require explicit closing
-        # The resources will be released when the object is garbage collected
-        pass
+        # Unmap the image; a plain pytsk3.Img_Info is released on garbage collection
+        if isinstance(self.img_handle, MmapImgInfo):
+            self.img_handle.close()
+        self.img_fd = None
+        self._fs_cache.clear()
 
 
 # Example usage:
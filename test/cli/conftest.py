@@ -1,24 +1,32 @@
 """CLI-specific fixtures for pytest."""
 
+import copy
+import io
+import sys
 from pathlib import Path
+from unittest.mock import MagicMock
 
+import click
 import pytest
 from click.testing import CliRunner
+from rich.console import Console
 
+from adibuild.cli import main as cli_main
+from adibuild.cli.helpers import load_config_with_overrides
+from adibuild.cli.main import build_linux, cli
+from adibuild.core.config import BuildConfig
+from adibuild.core.executor import BuildError
 from adibuild.core.toolchain import ToolchainInfo
 
+# The MCP tests call the tool functions directly, so fastmcp is always replaced
+# with a stub whose @mcp.tool() hands back the undecorated function. Installed
+# here so it is in place before any test module imports adibuild.cli.mcp_server.
+_fastmcp = MagicMock()
+_fastmcp.FastMCP.return_value.tool.return_value = lambda f: f
+sys.modules["fastmcp"] = _fastmcp
 
-@pytest.fixture
-def cli_runner():
-    """Click CLI test runner."""
-    return CliRunner()
-
-
-@pytest.fixture
-def mock_config_file(tmp_path):
-    """Create a temporary valid config file."""
-    config_file = tmp_path / "test_config.yaml"
-    config_content = """project: linux
+# Fixture files are written once per session and must not be modified by tests
+_CONFIG_YAML = b"""project: linux
 repository: https://github.com/analogdevicesinc/linux.git
 tag: 2023_R2
 
@@ -61,19 +69,290 @@ platforms:
         - arm
         - system
 """
-    config_file.write_text(config_content)
+
+_INVALID_CONFIG_YAML = b"""project: linux
+# Missing required fields
+platforms: {}
+"""
+
+_SCHEMA_YAML = b"""$schema: http://json-schema.org/draft-07/schema#
+type: object
+required:
+  - project
+  - repository
+  - platforms
+properties:
+  project:
+    type: string
+  repository:
+    type: string
+  tag:
+    type: string
+  platforms:
+    type: object
+"""
+
+# Config returned by mock_config_loading; copied per test because CLI commands
+# apply overrides with config.set()
+_CONFIG_DATA = {
+    "project": "linux",
+    "repository": "https://github.com/analogdevicesinc/linux.git",
+    "tag": "2023_R2",
+    "build": {
+        "parallel_jobs": 4,
+        "clean_before": False,
+        "output_dir": "./build",
+    },
+    "platforms": {
+        "zynq": {
+            "arch": "arm",
+            "cross_compile": "arm-linux-gnueabihf-",
+            "defconfig": "zynq_xcomm_adv7511_defconfig",
+            "kernel_target": "uImage",
+            "uimage_loadaddr": "0x8000",
+            "dtb_path": "arch/arm/boot/dts",
+            "kernel_image_path": "arch/arm/boot/uImage",
+            "dtbs": ["zynq-zc702-adv7511-ad9361-fmcomms2-3.dtb"],
+            "toolchain": {
+                "preferred": "vivado",
+                "fallback": ["arm", "system"],
+            },
+        },
+        "zynqmp": {
+            "arch": "arm64",
+            "cross_compile": "aarch64-linux-gnu-",
+            "defconfig": "adi_zynqmp_defconfig",
+            "kernel_target": "Image",
+            "dtb_path": "arch/arm64/boot/dts/xilinx",
+            "kernel_image_path": "arch/arm64/boot/Image",
+            "dtbs": ["zynqmp-zcu102-rev10-ad9361-fmcomms2-3.dtb"],
+            "toolchain": {
+                "preferred": "vivado",
+                "fallback": ["arm", "system"],
+            },
+        },
+        "microblaze": {
+            "arch": "microblaze",
+            "cross_compile": "microblaze-xilinx-linux-gnu-",
+            "defconfig": "adi_mb_defconfig",
+            "kernel_target": "simpleImage.vcu118",
+            "kernel_image_path": "arch/microblaze/boot/simpleImage.vcu118",
+            "simpleimage_targets": ["simpleImage.vcu118"],
+            "toolchain": {
+                "preferred": "vivado",
+                "fallback": [],
+            },
+        },
+    },
+}
+
+# HDL config served by mock_hdl_config instead of parsing YAML from disk
+_HDL_CONFIG_DATA = {
+    "project": "hdl",
+    "repository": "https://github.com/analogdevicesinc/hdl.git",
+    "tag": "hdl_2023_r2",
+    "platforms": {
+        "zed_fmcomms2": {
+            "arch": "arm",
+            "hdl_project": "fmcomms2",
+            "carrier": "zed",
+            "make_variables": {"RX_LANE_RATE": 2.5},
+        },
+        "zcu102_daq2": {
+            "arch": "arm64",
+            "hdl_project": "daq2",
+            "carrier": "zcu102",
+        },
+        "test_plat": {
+            "arch": "arm",
+            "hdl_project": "test",
+            "carrier": "test",
+        },
+    },
+}
+
+
+class _StubMethod:
+    """Records calls and mirrors the subset of the Mock API the CLI tests use."""
+
+    def __init__(self):
+        self.return_value = None
+        self.side_effect = None
+        self.call_args_list = []
+
+    def __call__(self, *args, **kwargs):
+        self.call_args_list.append((args, kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+    def assert_called_once(self):
+        assert (
+            len(self.call_args_list) == 1
+        ), f"Expected one call, got {len(self.call_args_list)}"
+
+    def assert_called_once_with(self, *args, **kwargs):
+        self.assert_called_once()
+        assert self.call_args_list[0] == (
+            args,
+            kwargs,
+        ), f"Expected call {(args, kwargs)}, got {self.call_args_list[0]}"
+
+
+class BuilderStub:
+    """Stand-in for a LinuxBuilder instance, cheaper than a MagicMock.
+
+    Only the methods the linux commands call exist, so a command reaching for
+    anything else fails loudly. Set ``return_value`` or ``side_effect`` (an
+    exception) on a method to control it.
+    """
+
+    def __init__(self):
+        self.prepare_source = _StubMethod()
+        self.configure = _StubMethod()
+        self.build = _StubMethod()
+        self.build_dtbs = _StubMethod()
+        self.clean = _StubMethod()
+
+
+class ConfigStub:
+    """Stand-in for a BuildConfig that serves one platform config and records set().
+
+    ``platform_config`` is handed out by reference, so tests can check how the
+    command changed it. ``sets`` lists the ``(key, value)`` pairs passed to set().
+    """
+
+    def __init__(self, platform_config=None):
+        self.platform_config = {} if platform_config is None else platform_config
+        self.sets = []
+
+    def get_platform(self, platform):
+        return self.platform_config
+
+    def set(self, key, value):
+        self.sets.append((key, value))
+
+
+@pytest.fixture
+def builder_stub():
+    """Fresh BuilderStub for a test."""
+    return BuilderStub()
+
+
+@pytest.fixture
+def serve_config_stub(mocker):
+    """Return a factory that makes the CLI load a ConfigStub.
+
+    Call it with the platform config dict the stub should serve.
+    """
+
+    def serve(platform_config=None):
+        config = ConfigStub(platform_config)
+        mocker.patch.object(cli_main, "load_config_with_overrides", return_value=config)
+        return config
+
+    return serve
+
+
+@pytest.fixture(scope="session")
+def cli_runner():
+    """Click CLI test runner, shared by every test since it keeps no state."""
+    return CliRunner()
+
+
+@pytest.fixture
+def recorded_console(mocker):
+    """Replace the CLI helpers console with one that records into memory.
+
+    Read what was printed with ``recorded_console.export_text()``.
+    """
+    console = Console(record=True, file=io.StringIO(), width=80)
+    mocker.patch("adibuild.cli.helpers.console", console)
+    return console
+
+
+@pytest.fixture(scope="session")
+def help_text():
+    """Return the help text of ``adibuild`` or one of its subcommands.
+
+    ``help_text("noos", "build")`` renders the same text as
+    ``adibuild noos build --help``, without going through the CLI runner.
+    """
+
+    def render(*command_path):
+        ctx = click.Context(cli, info_name="adibuild")
+        command = cli
+        for name in command_path:
+            command = command.get_command(ctx, name)
+            ctx = click.Context(command, info_name=name, parent=ctx)
+        return command.get_help(ctx)
+
+    return render
+
+
+@pytest.fixture(scope="session")
+def invoke_cli():
+    """Run the adibuild CLI in-process and return its exit code.
+
+    Unlike cli_runner this does not redirect streams or capture output, so use it
+    only in tests that check the exit code or side effects.
+    """
+
+    def invoke(args):
+        try:
+            rv = cli.main(args=args, prog_name="adibuild", standalone_mode=False)
+        except SystemExit as e:
+            return 0 if e.code is None else e.code
+        return rv if isinstance(rv, int) else 0
+
+    return invoke
+
+
+@pytest.fixture(scope="session")
+def invoke_linux_build():
+    """Run ``linux build`` directly and return its exit code.
+
+    The arguments are parsed by the build command alone, skipping dispatch
+    through the cli and linux groups. ctx.obj is seeded with the defaults the
+    cli group would store, so only use this when no global options are needed.
+    """
+
+    def invoke(args):
+        try:
+            with build_linux.make_context(
+                "build", list(args), obj={"config_path": None, "verbose": 0}
+            ) as ctx:
+                build_linux.invoke(ctx)
+        except SystemExit as e:
+            return 0 if e.code is None else e.code
+        return 0
+
+    return invoke
+
+
+@pytest.fixture(scope="session")
+def mock_config_file(tmp_path_factory):
+    """Create a temporary valid config file."""
+    config_file = tmp_path_factory.mktemp("config") / "test_config.yaml"
+    config_file.write_bytes(_CONFIG_YAML)
     return config_file
 
 
 @pytest.fixture
-def mock_invalid_config_file(tmp_path):
+def workflow_config(mock_config_file):
+    """Load the shared config file for zynqmp the way the CLI does.
+
+    BuildConfig.from_yaml reuses the parsed file and hands out a fresh copy, so
+    tests may modify the returned config.
+    """
+    return load_config_with_overrides(str(mock_config_file), "zynqmp", None)
+
+
+@pytest.fixture(scope="session")
+def mock_invalid_config_file(tmp_path_factory):
     """Create a temporary invalid config file."""
-    config_file = tmp_path / "invalid_config.yaml"
-    config_content = """project: linux
-# Missing required fields
-platforms: {}
-"""
-    config_file.write_text(config_content)
+    config_file = tmp_path_factory.mktemp("config") / "invalid_config.yaml"
+    config_file.write_bytes(_INVALID_CONFIG_YAML)
     return config_file
 
 
@@ -110,8 +389,6 @@ def mock_build_success(mocker, tmp_path):
 @pytest.fixture
 def mock_build_failure(mocker):
     """Mock failed build workflow."""
-    from adibuild.core.executor import BuildError
-
     # Mock LinuxBuilder.build() to raise BuildError
     mocker.patch(
         "adibuild.projects.linux.LinuxBuilder.build",
@@ -206,88 +483,43 @@ def mock_linux_builder(mocker, tmp_path):
 @pytest.fixture
 def mock_config_loading(mocker, mock_config_file):
     """Mock config loading to return a valid config."""
-    from adibuild.core.config import BuildConfig
-
-    # Create a valid config object
-    config_data = {
-        "project": "linux",
-        "repository": "https://github.com/analogdevicesinc/linux.git",
-        "tag": "2023_R2",
-        "build": {
-            "parallel_jobs": 4,
-            "clean_before": False,
-            "output_dir": "./build",
-        },
-        "platforms": {
-            "zynq": {
-                "arch": "arm",
-                "cross_compile": "arm-linux-gnueabihf-",
-                "defconfig": "zynq_xcomm_adv7511_defconfig",
-                "kernel_target": "uImage",
-                "uimage_loadaddr": "0x8000",
-                "dtb_path": "arch/arm/boot/dts",
-                "kernel_image_path": "arch/arm/boot/uImage",
-                "dtbs": ["zynq-zc702-adv7511-ad9361-fmcomms2-3.dtb"],
-                "toolchain": {
-                    "preferred": "vivado",
-                    "fallback": ["arm", "system"],
-                },
-            },
-            "zynqmp": {
-                "arch": "arm64",
-                "cross_compile": "aarch64-linux-gnu-",
-                "defconfig": "adi_zynqmp_defconfig",
-                "kernel_target": "Image",
-                "dtb_path": "arch/arm64/boot/dts/xilinx",
-                "kernel_image_path": "arch/arm64/boot/Image",
-                "dtbs": ["zynqmp-zcu102-rev10-ad9361-fmcomms2-3.dtb"],
-                "toolchain": {
-                    "preferred": "vivado",
-                    "fallback": ["arm", "system"],
-                },
-            },
-            "microblaze": {
-                "arch": "microblaze",
-                "cross_compile": "microblaze-xilinx-linux-gnu-",
-                "defconfig": "adi_mb_defconfig",
-                "kernel_target": "simpleImage.vcu118",
-                "kernel_image_path": "arch/microblaze/boot/simpleImage.vcu118",
-                "simpleimage_targets": ["simpleImage.vcu118"],
-                "toolchain": {
-                    "preferred": "vivado",
-                    "fallback": [],
-                },
-            },
-        },
-    }
-
-    config = BuildConfig.from_dict(config_data)
+    config = BuildConfig.from_dict(copy.deepcopy(_CONFIG_DATA))
 
     # Mock load_config_with_overrides to return our config
-    mocker.patch("adibuild.cli.main.load_config_with_overrides", return_value=config)
+    mocker.patch.object(cli_main, "load_config_with_overrides", return_value=config)
 
     return config
 
 
 @pytest.fixture
-def mock_schema_file(tmp_path):
+def serve_hdl_config(mocker, mock_config_file):
+    """Return a function that serves _HDL_CONFIG_DATA from BuildConfig.from_yaml.
+
+    Keyword arguments replace top-level keys of the served config. The function
+    returns a path to pass as --config, which click requires to exist. Every load
+    gets its own copy because hdl build applies overrides with config.set().
+    """
+
+    def serve(**overrides):
+        data = {**_HDL_CONFIG_DATA, **overrides}
+        mocker.patch(
+            "adibuild.core.config.BuildConfig.from_yaml",
+            side_effect=lambda path: BuildConfig.from_dict(copy.deepcopy(data)),
+        )
+        return mock_config_file
+
+    return serve
+
+
+@pytest.fixture
+def mock_hdl_config(serve_hdl_config):
+    """Serve _HDL_CONFIG_DATA unchanged; see serve_hdl_config."""
+    return serve_hdl_config()
+
+
+@pytest.fixture(scope="session")
+def mock_schema_file(tmp_path_factory):
     """Create a temporary schema file for validation tests."""
-    schema_file = tmp_path / "config_schema.yaml"
-    schema_content = """$schema: http://json-schema.org/draft-07/schema#
-type: object
-required:
-  - project
-  - repository
-  - platforms
-properties:
-  project:
-    type: string
-  repository:
-    type: string
-  tag:
-    type: string
-  platforms:
-    type: object
-"""
-    schema_file.write_text(schema_content)
+    schema_file = tmp_path_factory.mktemp("schema") / "config_schema.yaml"
+    schema_file.write_bytes(_SCHEMA_YAML)
     return schema_file
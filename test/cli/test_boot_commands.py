@@ -124,7 +124,7 @@ def test_build_boot_docker_runner_defaults_image_from_tool_version(cli_runner, m
 
 
 def test_build_boot_generate_script_with_docker_runner(cli_runner, tmp_path, mocker):
-    mocker.patch("pathlib.Path.home", return_value=tmp_path)
+    mocker.patch("adibuild.utils.paths._home", return_value=tmp_path)
     config_file = tmp_path / "boot.yaml"
     config_file.write_text("""
 project: boot
@@ -1,32 +1,19 @@
 from adibuild.cli.main import cli
 
 
-def test_hdl_build_script_generation(cli_runner, tmp_path, mocker):
+def test_hdl_build_script_generation(
+    cli_runner, tmp_path, mocker, mock_hdl_config, assert_all_in
+):
     """Test generating a build script for HDL project."""
 
     # Mock home directory
-    mocker.patch("pathlib.Path.home", return_value=tmp_path)
-
-    # Create a config file defining the platform
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text("""
-project: hdl
-repository: https://github.com/analogdevicesinc/hdl.git
-tag: hdl_2023_r2
-platforms:
-  zed_fmcomms2:
-    arch: arm
-    hdl_project: fmcomms2
-    carrier: zed
-    make_variables:
-      RX_LANE_RATE: 2.5
-""")
+    mocker.patch("adibuild.utils.paths._home", return_value=tmp_path)
 
     result = cli_runner.invoke(
         cli,
         [
             "--config",
-            str(config_file),
+            str(mock_hdl_config),
             "hdl",
             "build",
             "-p",
@@ -45,37 +32,29 @@ platforms:
     assert script_file.exists()
     content = script_file.read_text()
 
-    assert "git clone" in content
-    assert "projects/fmcomms2/zed" in content
-    assert "RX_LANE_RATE=2.5" in content
-
-    # Check for artifact copy commands (generic find)
-    assert "find" in content
-    assert "*.xsa" in content
-    assert "*.bit" in content
+    assert_all_in(
+        content,
+        [
+            "git clone",
+            "projects/fmcomms2/zed",
+            "RX_LANE_RATE=2.5",
+            # Artifact copy commands (generic find)
+            "find",
+            "*.xsa",
+            "*.bit",
+        ],
+    )
 
 
-def test_hdl_build_clean(cli_runner, tmp_path, mocker):
+def test_hdl_build_clean(cli_runner, tmp_path, mocker, mock_hdl_config, assert_all_in):
     """Test hdl build with clean flag (script generation to verify clean command)."""
-    mocker.patch("pathlib.Path.home", return_value=tmp_path)
-
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text("""
-project: hdl
-repository: https://github.com/analogdevicesinc/hdl.git
-tag: hdl_2023_r2
-platforms:
-  zcu102_daq2:
-    arch: arm64
-    hdl_project: daq2
-    carrier: zcu102
-""")
+    mocker.patch("adibuild.utils.paths._home", return_value=tmp_path)
 
     result = cli_runner.invoke(
         cli,
         [
             "--config",
-            str(config_file),
+            str(mock_hdl_config),
             "hdl",
             "build",
             "-p",
@@ -91,22 +70,15 @@ platforms:
     script_file = work_dir / "build_hdl_arm64.sh"
     content = script_file.read_text()
 
-    assert "make" in content
-    assert "clean" in content
-    assert "-C" in content
+    assert_all_in(content, ["make", "clean", "-C"])
 
 
-def test_hdl_build_dynamic_args(cli_runner, tmp_path, mocker):
+def test_hdl_build_dynamic_args(cli_runner, tmp_path, mocker, serve_hdl_config):
     """Test hdl build using --project and --carrier dynamic arguments."""
-    mocker.patch("pathlib.Path.home", return_value=tmp_path)
+    mocker.patch("adibuild.utils.paths._home", return_value=tmp_path)
 
-    # Create a config file just for repo URL, no platform definitions
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text("""
-project: hdl
-repository: https://github.com/analogdevicesinc/hdl.git
-tag: hdl_2023_r2
-""")
+    # Config only supplies the repo URL, no platform definitions
+    config_file = serve_hdl_config(platforms={})
 
     result = cli_runner.invoke(
         cli,
@@ -136,23 +108,12 @@ tag: hdl_2023_r2
     assert "projects/fmcomms2/zed" in content
 
 
-def test_hdl_build_docker_script_generation(cli_runner, tmp_path, mocker):
-    mocker.patch("pathlib.Path.home", return_value=tmp_path)
-
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text("""
-project: hdl
-repository: https://github.com/analogdevicesinc/hdl.git
-tag: 2023_R2
-build:
-  runner: docker
-platforms:
-  zed_fmcomms2:
-    arch: arm
-    hdl_project: fmcomms2
-    carrier: zed
-    tool_version: 2023.2
-""")
+def test_hdl_build_docker_script_generation(
+    cli_runner, tmp_path, mocker, serve_hdl_config, assert_all_in
+):
+    mocker.patch("adibuild.utils.paths._home", return_value=tmp_path)
+
+    config_file = serve_hdl_config(tag="2023_R2", build={"runner": "docker"})
 
     result = cli_runner.invoke(
         cli,
@@ -173,8 +134,7 @@ platforms:
 
     script_file = tmp_path / ".adibuild" / "work" / "build_hdl_arm.sh"
     content = script_file.read_text()
-    assert "docker run --rm" in content
-    assert "custom/vivado:2023.2" in content
+    assert_all_in(content, ["docker run --rm", "custom/vivado:2023.2"])
 
 
 def test_hdl_build_missing_args(cli_runner, tmp_path):
@@ -189,27 +149,15 @@ def test_hdl_build_missing_args(cli_runner, tmp_path):
     )
 
 
-def test_hdl_build_power_report(cli_runner, tmp_path, mocker):
+def test_hdl_build_power_report(cli_runner, tmp_path, mocker, mock_hdl_config):
     """Test hdl build with --power-report flag."""
-    mocker.patch("pathlib.Path.home", return_value=tmp_path)
-
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text("""
-project: hdl
-repository: https://github.com/analogdevicesinc/hdl.git
-tag: hdl_2023_r2
-platforms:
-  zed_fmcomms2:
-    arch: arm
-    hdl_project: fmcomms2
-    carrier: zed
-""")
+    mocker.patch("adibuild.utils.paths._home", return_value=tmp_path)
 
     result = cli_runner.invoke(
         cli,
         [
             "--config",
-            str(config_file),
+            str(mock_hdl_config),
             "hdl",
             "build",
             "-p",
@@ -228,27 +176,15 @@ platforms:
     assert "export ADI_GENERATE_XPA='1'" in content
 
 
-def test_hdl_build_utilization_report(cli_runner, tmp_path, mocker):
+def test_hdl_build_utilization_report(cli_runner, tmp_path, mocker, mock_hdl_config):
     """Test hdl build with --utilization-report flag."""
-    mocker.patch("pathlib.Path.home", return_value=tmp_path)
-
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text("""
-project: hdl
-repository: https://github.com/analogdevicesinc/hdl.git
-tag: hdl_2023_r2
-platforms:
-  zed_fmcomms2:
-    arch: arm
-    hdl_project: fmcomms2
-    carrier: zed
-""")
+    mocker.patch("adibuild.utils.paths._home", return_value=tmp_path)
 
     result = cli_runner.invoke(
         cli,
         [
             "--config",
-            str(config_file),
+            str(mock_hdl_config),
             "hdl",
             "build",
             "-p",
@@ -267,10 +203,10 @@ platforms:
     assert "export ADI_GENERATE_UTILIZATION='1'" in content
 
 
-def test_hdl_build_caching(cli_runner, tmp_path, mocker):
+def test_hdl_build_caching(cli_runner, tmp_path, mocker, serve_hdl_config):
     """Test hdl build caching logic."""
-    # Ensure all Path.home() calls return the same tmp_path
-    mocker.patch("pathlib.Path.home", return_value=tmp_path)
+    # Ensure every adibuild home lookup returns the same tmp_path
+    mocker.patch("adibuild.utils.paths._home", return_value=tmp_path)
 
     # Mock source preparation to return a path and set self.repo and self.source_dir
     mock_repo = mocker.MagicMock()
@@ -298,8 +234,8 @@ def test_hdl_build_caching(cli_runner, tmp_path, mocker):
     def side_effect_package(self, project_dir, hdl_project, carrier):
         output_dir = self.get_output_dir()
         output_dir.mkdir(parents=True, exist_ok=True)
-        (output_dir / "system_top.bit").write_text("dummy bitstream")
-        (output_dir / "system_top.xsa").write_text("dummy xsa")
+        (output_dir / "system_top.bit").write_bytes(b"dummy bitstream")
+        (output_dir / "system_top.xsa").write_bytes(b"dummy xsa")
         return {
             "artifacts": {
                 "bit": [str(output_dir / "system_top.bit")],
@@ -319,19 +255,7 @@ def test_hdl_build_caching(cli_runner, tmp_path, mocker):
         parents=True, exist_ok=True
     )
 
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text(f"""
-project: hdl
-repository: https://github.com/analogdevicesinc/hdl.git
-tag: hdl_2023_r2
-build:
-  output_dir: {tmp_path / 'build'}
-platforms:
-  zed_fmcomms2:
-    arch: arm
-    hdl_project: fmcomms2
-    carrier: zed
-""")
+    config_file = serve_hdl_config(build={"output_dir": str(tmp_path / "build")})
 
     # First build - should NOT be cached
     result1 = cli_runner.invoke(
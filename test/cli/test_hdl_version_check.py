@@ -1,27 +1,15 @@
 from adibuild.cli.main import cli
 
 
-def test_hdl_build_with_ignore_check(cli_runner, tmp_path, mocker):
+def test_hdl_build_with_ignore_check(cli_runner, tmp_path, mocker, mock_hdl_config):
     """Test hdl build with --ignore-version-check flag."""
-    mocker.patch("pathlib.Path.home", return_value=tmp_path)
-
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text("""
-project: hdl
-repository: https://github.com/analogdevicesinc/hdl.git
-tag: hdl_2023_r2
-platforms:
-  test_plat:
-    hdl_project: test
-    carrier: test
-    arch: arm
-""")
+    mocker.patch("adibuild.utils.paths._home", return_value=tmp_path)
 
     result = cli_runner.invoke(
         cli,
         [
             "--config",
-            str(config_file),
+            str(mock_hdl_config),
             "hdl",
             "build",
             "-p",
@@ -39,27 +27,15 @@ platforms:
     assert "export ADI_IGNORE_VERSION_CHECK='1'" in content
 
 
-def test_hdl_build_without_ignore_check(cli_runner, tmp_path, mocker):
+def test_hdl_build_without_ignore_check(cli_runner, tmp_path, mocker, mock_hdl_config):
     """Test hdl build without flag (should not set env var in script mode)."""
-    mocker.patch("pathlib.Path.home", return_value=tmp_path)
-
-    config_file = tmp_path / "config.yaml"
-    config_file.write_text("""
-project: hdl
-repository: https://github.com/analogdevicesinc/hdl.git
-tag: hdl_2023_r2
-platforms:
-  test_plat:
-    hdl_project: test
-    carrier: test
-    arch: arm
-""")
+    mocker.patch("adibuild.utils.paths._home", return_value=tmp_path)
 
     result = cli_runner.invoke(
         cli,
         [
             "--config",
-            str(config_file),
+            str(mock_hdl_config),
             "hdl",
             "build",
             "-p",
@@ -1,17 +1,21 @@
 """Tests for CLI helper functions."""
 
+import json
 from pathlib import Path
 
 import pytest
 
 from adibuild import __version__
 from adibuild.cli.helpers import (
+    _simpleimage_preset_table,
     create_default_config,
     display_build_summary,
     display_platforms,
     display_toolchain_info,
     get_platform_instance,
+    get_simpleimage_presets,
     load_config_with_overrides,
+    load_fabric_release_info,
     print_error,
     print_success,
     print_version,
@@ -28,13 +32,13 @@ from adibuild.platforms.zynqmp import ZynqMPPlatform
 # ============================================================================
 
 
-def test_print_version(capsys):
+def test_print_version(recorded_console):
     """Test print_version outputs version information."""
     print_version()
-    captured = capsys.readouterr()
+    output = recorded_console.export_text()
 
-    assert "adibuild" in captured.out
-    assert __version__ in captured.out
+    assert "adibuild" in output
+    assert __version__ in output
 
 
 def test_print_error_exits(mocker):
@@ -46,33 +50,33 @@ def test_print_error_exits(mocker):
     mock_exit.assert_called_once_with(1)
 
 
-def test_print_error_message(capsys, mocker):
+def test_print_error_message(recorded_console, mocker):
     """Test print_error prints error message."""
     mocker.patch("sys.exit")  # Prevent actual exit
 
     print_error("Test error message")
-    captured = capsys.readouterr()
+    output = recorded_console.export_text()
 
-    assert "Error" in captured.out
-    assert "Test error message" in captured.out
+    assert "Error" in output
+    assert "Test error message" in output
 
 
-def test_print_success(capsys):
+def test_print_success(recorded_console):
     """Test print_success prints success message."""
     print_success("Operation successful")
-    captured = capsys.readouterr()
+    output = recorded_console.export_text()
 
-    assert "Operation successful" in captured.out
+    assert "Operation successful" in output
     # Success messages typically have checkmarks or success indicators
 
 
-def test_print_warning(capsys):
+def test_print_warning(recorded_console):
     """Test print_warning prints warning message."""
     print_warning("This is a warning")
-    captured = capsys.readouterr()
+    output = recorded_console.export_text()
 
-    assert "Warning" in captured.out
-    assert "This is a warning" in captured.out
+    assert "Warning" in output
+    assert "This is a warning" in output
 
 
 # ============================================================================
@@ -80,49 +84,18 @@ def test_print_warning(capsys):
 # ============================================================================
 
 
-def test_load_config_with_overrides_custom_file(tmp_path):
+def test_load_config_with_overrides_custom_file(mock_config_file):
     """Test load_config_with_overrides with custom config file."""
-    # Create a config file
-    config_file = tmp_path / "custom_config.yaml"
-    config_content = """project: linux
-repository: https://github.com/analogdevicesinc/linux.git
-tag: 2023_R2
-build:
-  parallel_jobs: 8
-platforms:
-  zynqmp:
-    arch: arm64
-    cross_compile: aarch64-linux-gnu-
-    defconfig: adi_zynqmp_defconfig
-    kernel_target: Image
-"""
-    config_file.write_text(config_content)
-
-    config = load_config_with_overrides(str(config_file), "zynqmp", None)
+    config = load_config_with_overrides(str(mock_config_file), "zynqmp", None)
 
     assert config is not None
     assert config.get("project") == "linux"
     assert config.get("tag") == "2023_R2"
 
 
-def test_load_config_with_overrides_tag_override(tmp_path):
+def test_load_config_with_overrides_tag_override(mock_config_file):
     """Test load_config_with_overrides with tag override."""
-    config_file = tmp_path / "config.yaml"
-    config_content = """project: linux
-repository: https://github.com/analogdevicesinc/linux.git
-tag: 2023_R2
-build:
-  parallel_jobs: 4
-platforms:
-  zynqmp:
-    arch: arm64
-    cross_compile: aarch64-linux-gnu-
-    defconfig: adi_zynqmp_defconfig
-    kernel_target: Image
-"""
-    config_file.write_text(config_content)
-
-    config = load_config_with_overrides(str(config_file), "zynqmp", "2024_R1")
+    config = load_config_with_overrides(str(mock_config_file), "zynqmp", "2024_R1")
 
     assert config.get("tag") == "2024_R1"
 
@@ -237,10 +210,8 @@ def test_get_platform_instance_invalid(mocker):
 # ============================================================================
 
 
-def test_display_build_summary(capsys, mock_toolchain):
+def test_display_build_summary(recorded_console, mock_toolchain):
     """Test display_build_summary shows build information."""
-    from adibuild.platforms.zynqmp import ZynqMPPlatform
-
     platform_config = {
         "arch": "arm64",
         "cross_compile": "aarch64-linux-gnu-",
@@ -258,18 +229,16 @@ def test_display_build_summary(capsys, mock_toolchain):
     }
 
     display_build_summary(result, platform)
-    captured = capsys.readouterr()
+    output = recorded_console.export_text()
 
-    assert "Build Summary" in captured.out or "Build" in captured.out
-    assert "arm64" in captured.out
-    assert "adi_zynqmp_defconfig" in captured.out
-    assert "Image" in captured.out
+    assert "Build Summary" in output or "Build" in output
+    assert "arm64" in output
+    assert "adi_zynqmp_defconfig" in output
+    assert "Image" in output
 
 
-def test_display_build_summary_minimal(capsys):
+def test_display_build_summary_minimal(recorded_console):
     """Test display_build_summary with minimal result data."""
-    from adibuild.platforms.zynq import ZynqPlatform
-
     platform_config = {
         "arch": "arm",
         "cross_compile": "arm-linux-gnueabihf-",
@@ -283,14 +252,14 @@ def test_display_build_summary_minimal(capsys):
     }
 
     display_build_summary(result, platform)
-    captured = capsys.readouterr()
+    output = recorded_console.export_text()
 
     # Should still display basic info even with minimal data
-    assert "arm" in captured.out
-    assert "zynq_xcomm_adv7511_defconfig" in captured.out
+    assert "arm" in output
+    assert "zynq_xcomm_adv7511_defconfig" in output
 
 
-def test_display_toolchain_info_vivado(capsys):
+def test_display_toolchain_info_vivado(recorded_console):
     """Test display_toolchain_info with Vivado toolchain."""
     toolchain = ToolchainInfo(
         type="vivado",
@@ -302,15 +271,15 @@ def test_display_toolchain_info_vivado(capsys):
     )
 
     display_toolchain_info(toolchain)
-    captured = capsys.readouterr()
+    output = recorded_console.export_text()
 
-    assert "vivado" in captured.out.lower()
-    assert "2023.2" in captured.out
-    assert "arm-linux-gnueabihf-" in captured.out
-    assert "aarch64-linux-gnu-" in captured.out
+    assert "vivado" in output.lower()
+    assert "2023.2" in output
+    assert "arm-linux-gnueabihf-" in output
+    assert "aarch64-linux-gnu-" in output
 
 
-def test_display_toolchain_info_dict(capsys):
+def test_display_toolchain_info_dict(recorded_console):
     """Test display_toolchain_info with dictionary (from mocks)."""
     toolchain_dict = {
         "type": "vivado",
@@ -331,12 +300,12 @@ def test_display_toolchain_info_dict(capsys):
     )
 
     display_toolchain_info(toolchain)
-    captured = capsys.readouterr()
+    output = recorded_console.export_text()
 
-    assert "vivado" in captured.out.lower()
+    assert "vivado" in output.lower()
 
 
-def test_display_platforms(capsys):
+def test_display_platforms(recorded_console):
     """Test display_platforms shows platform information."""
     config_data = {
         "project": "linux",
@@ -359,15 +328,15 @@ def test_display_platforms(capsys):
 
     config = BuildConfig.from_dict(config_data)
     display_platforms(config)
-    captured = capsys.readouterr()
+    output = recorded_console.export_text()
 
-    assert "zynq" in captured.out.lower() or "Platform" in captured.out
-    assert "zynqmp" in captured.out.lower() or "Platform" in captured.out
-    assert "arm" in captured.out
-    assert "arm64" in captured.out
+    assert "zynq" in output.lower() or "Platform" in output
+    assert "zynqmp" in output.lower() or "Platform" in output
+    assert "arm" in output
+    assert "arm64" in output
 
 
-def test_display_platforms_empty(capsys):
+def test_display_platforms_empty(recorded_console):
     """Test display_platforms with no platforms defined."""
     config_data = {
         "project": "linux",
@@ -377,9 +346,9 @@ def test_display_platforms_empty(capsys):
 
     config = BuildConfig.from_dict(config_data)
     display_platforms(config)
-    captured = capsys.readouterr()
+    output = recorded_console.export_text()
 
-    assert "No platforms" in captured.out or "Warning" in captured.out
+    assert "No platforms" in output or "Warning" in output
 
 
 # ============================================================================
@@ -430,9 +399,15 @@ def test_validate_config_file_invalid(tmp_path, mocker):
 # ============================================================================
 
 
-def test_create_default_config(tmp_path, mocker):
+@pytest.fixture(scope="module")
+def cfg_dir(tmp_path_factory):
+    """Directory shared by the config creation tests; each writes its own file."""
+    return tmp_path_factory.mktemp("cfgs")
+
+
+def test_create_default_config(cfg_dir, mocker):
     """Test create_default_config creates configuration file."""
-    output_file = tmp_path / "new_config.yaml"
+    output_file = cfg_dir / "new_config.yaml"
 
     # Mock the interactive prompt
     mock_prompt_config = mocker.patch("adibuild.cli.helpers.prompt_for_config")
@@ -447,9 +422,9 @@ def test_create_default_config(tmp_path, mocker):
     assert output_file.exists()
 
 
-def test_create_default_config_with_toolchain(tmp_path, mocker):
+def test_create_default_config_with_toolchain(cfg_dir, mocker):
     """Test create_default_config with toolchain configuration."""
-    output_file = tmp_path / "config_with_toolchain.yaml"
+    output_file = cfg_dir / "config_with_toolchain.yaml"
 
     mock_prompt_config = mocker.patch("adibuild.cli.helpers.prompt_for_config")
     mock_prompt_config.return_value = {
@@ -469,32 +444,81 @@ def test_create_default_config_with_toolchain(tmp_path, mocker):
 # ============================================================================
 
 
-def test_config_load_platform_build_workflow(tmp_path):
+def test_config_load_platform_build_workflow(workflow_config):
     """Test complete workflow: load config -> get platform -> display."""
-    # Create config
-    config_file = tmp_path / "workflow_config.yaml"
-    config_content = """project: linux
-repository: https://github.com/analogdevicesinc/linux.git
-tag: 2023_R2
-platforms:
-  zynqmp:
-    arch: arm64
-    cross_compile: aarch64-linux-gnu-
-    defconfig: adi_zynqmp_defconfig
-    kernel_target: Image
-    dtbs:
-      - test.dtb
-"""
-    config_file.write_text(config_content)
-
-    # Load config
-    config = load_config_with_overrides(str(config_file), "zynqmp", None)
-    assert config is not None
-
     # Get platform
-    platform = get_platform_instance(config, "zynqmp")
+    platform = get_platform_instance(workflow_config, "zynqmp")
     assert isinstance(platform, ZynqMPPlatform)
 
     # Display would happen here (already tested separately)
     assert platform.arch == "arm64"
     assert platform.defconfig == "adi_zynqmp_defconfig"
+
+
+# ============================================================================
+# simpleImage Preset Tests
+# ============================================================================
+
+FABRIC_RELEASE_INFO = {
+    "2023_R2": {
+        "ad9081": [
+            {
+                "carrier": "vcu118",
+                "dts_path": "arch/microblaze/boot/dts/vcu118_ad9081.dts",
+            }
+        ],
+        "adrv9009": [
+            {
+                "carrier": "kcu105",
+                "dts_path": "arch/microblaze/boot/dts/kcu105_adrv9009.dts",
+            }
+        ],
+    }
+}
+
+
+@pytest.fixture
+def fabric_release_info(mocker):
+    """Serve FABRIC_RELEASE_INFO from an empty preset cache."""
+    _simpleimage_preset_table.cache_clear()
+    mock_load = mocker.patch(
+        "adibuild.cli.helpers.load_fabric_release_info",
+        return_value=FABRIC_RELEASE_INFO,
+    )
+    yield mock_load
+    _simpleimage_preset_table.cache_clear()
+
+
+def test_get_simpleimage_presets_filters_carrier(fabric_release_info):
+    """Test get_simpleimage_presets maps dts files to targets and filters carriers."""
+    assert get_simpleimage_presets("2023_R2", carrier="kcu105") == [
+        {
+            "project": "adrv9009",
+            "carrier": "kcu105",
+            "simpleimage_target": "simpleImage.kcu105_adrv9009",
+            "dts_path": "arch/microblaze/boot/dts/kcu105_adrv9009.dts",
+        }
+    ]
+    assert len(get_simpleimage_presets("2023_R2")) == 2
+    assert get_simpleimage_presets("2019_R1") == []
+
+
+def test_get_simpleimage_presets_builds_table_once(fabric_release_info):
+    """Test repeated lookups reuse the preset table without leaking edits."""
+    presets = get_simpleimage_presets("2023_R2")
+    presets[0]["carrier"] = "changed"
+
+    assert get_simpleimage_presets("2023_R2")[0]["carrier"] == "vcu118"
+    fabric_release_info.assert_called_once()
+
+
+def test_load_fabric_release_info_parses_once(mocker):
+    """Test the release info file is read on first use only."""
+    load_fabric_release_info.cache_clear()
+    spy = mocker.patch("adibuild.cli.helpers.json.loads", wraps=json.loads)
+    try:
+        first = load_fabric_release_info()
+        assert load_fabric_release_info() is first
+        assert spy.call_count == 1
+    finally:
+        load_fabric_release_info.cache_clear()
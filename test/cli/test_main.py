@@ -1,11 +1,24 @@
 """Tests for the root CLI and global options."""
 
 import logging
+from unittest.mock import MagicMock
+
+import click
+import pytest
 
 from adibuild import __version__
+from adibuild.cli import main as cli_main
 from adibuild.cli.main import cli
 
 
+@pytest.fixture(autouse=True)
+def mock_setup_logging(monkeypatch):
+    """Keep the root CLI from reconfiguring logging; returns the replacement mock."""
+    mock = MagicMock()
+    monkeypatch.setattr(cli_main, "setup_logging", mock)
+    return mock
+
+
 def test_version_flag(cli_runner):
     """Test --version flag displays version and exits."""
     result = cli_runner.invoke(cli, ["--version"], obj={})
@@ -15,16 +28,12 @@ def test_version_flag(cli_runner):
     assert __version__ in result.output
 
 
-def test_help_flag(cli_runner):
+def test_help_flag(help_text, assert_all_in):
     """Test --help flag displays help text."""
-    result = cli_runner.invoke(cli, ["--help"])
-
-    assert result.exit_code == 0
-    assert "adibuild" in result.output
-    assert "Build system for ADI projects" in result.output
-    assert "linux" in result.output
-    assert "toolchain" in result.output
-    assert "config" in result.output
+    assert_all_in(
+        help_text(),
+        ["adibuild", "Build system for ADI projects", "linux", "toolchain", "config"],
+    )
 
 
 def test_no_command_shows_help(cli_runner):
@@ -40,10 +49,8 @@ def test_no_command_shows_help(cli_runner):
     )
 
 
-def test_verbose_flag_default(cli_runner, mocker):
+def test_verbose_flag_default(cli_runner, mock_setup_logging):
     """Test default verbosity level (WARNING)."""
-    mock_setup_logging = mocker.patch("adibuild.cli.main.setup_logging")
-
     result = cli_runner.invoke(cli, ["linux", "--help"])
 
     # Should be called with WARNING level (no -v flag)
@@ -51,10 +58,8 @@ def test_verbose_flag_default(cli_runner, mocker):
     assert result.exit_code == 0
 
 
-def test_verbose_flag_single(cli_runner, mocker):
+def test_verbose_flag_single(cli_runner, mock_setup_logging):
     """Test single -v flag sets INFO level."""
-    mock_setup_logging = mocker.patch("adibuild.cli.main.setup_logging")
-
     result = cli_runner.invoke(cli, ["-v", "linux", "--help"])
 
     # Should be called with INFO level
@@ -62,10 +67,8 @@ def test_verbose_flag_single(cli_runner, mocker):
     assert result.exit_code == 0
 
 
-def test_verbose_flag_double(cli_runner, mocker):
+def test_verbose_flag_double(cli_runner, mock_setup_logging):
     """Test double -vv flag sets DEBUG level."""
-    mock_setup_logging = mocker.patch("adibuild.cli.main.setup_logging")
-
     result = cli_runner.invoke(cli, ["-vv", "linux", "--help"])
 
     # Should be called with DEBUG level
@@ -73,7 +76,7 @@ def test_verbose_flag_double(cli_runner, mocker):
     assert result.exit_code == 0
 
 
-def test_config_flag(cli_runner, mock_config_file, mocker):
+def test_config_flag(cli_runner, mock_config_file, zynqmp_config, mocker):
     """Test --config flag loads custom config file."""
     # Mock config loading and build
     mock_load_config = mocker.patch("adibuild.cli.main.load_config_with_overrides")
@@ -82,25 +85,7 @@ def test_config_flag(cli_runner, mock_config_file, mocker):
     mocker.patch("adibuild.cli.main.display_build_summary")
 
     # Setup mock returns
-    from adibuild.core.config import BuildConfig
-
-    mock_config = BuildConfig.from_dict(
-        {
-            "project": "linux",
-            "repository": "https://github.com/analogdevicesinc/linux.git",
-            "tag": "2023_R2",
-            "build": {"parallel_jobs": 4, "clean_before": False, "output_dir": "./build"},
-            "platforms": {
-                "zynqmp": {
-                    "arch": "arm64",
-                    "cross_compile": "aarch64-linux-gnu-",
-                    "defconfig": "adi_zynqmp_defconfig",
-                    "kernel_target": "Image",
-                }
-            },
-        }
-    )
-    mock_load_config.return_value = mock_config
+    mock_load_config.return_value = zynqmp_config
     mock_platform = mocker.MagicMock()
     mock_get_platform.return_value = mock_platform
 
@@ -117,50 +102,44 @@ def test_config_flag(cli_runner, mock_config_file, mocker):
     assert result.exit_code == 0 or result.exit_code == 1  # May fail if mocks incomplete
 
 
-def test_linux_command_group_help(cli_runner):
+def test_linux_command_group_help(help_text, assert_all_in):
     """Test linux command group shows help."""
-    result = cli_runner.invoke(cli, ["linux", "--help"])
-
-    assert result.exit_code == 0
-    assert "Linux kernel build commands" in result.output
-    assert "build" in result.output
-    assert "configure" in result.output
-    assert "menuconfig" in result.output
-    assert "dtbs" in result.output
-    assert "clean" in result.output
+    assert_all_in(
+        help_text("linux"),
+        [
+            "Linux kernel build commands",
+            "build",
+            "configure",
+            "menuconfig",
+            "dtbs",
+            "clean",
+        ],
+    )
 
 
-def test_toolchain_command_help(cli_runner):
+def test_toolchain_command_help(help_text):
     """Test toolchain command shows help."""
-    result = cli_runner.invoke(cli, ["toolchain", "--help"])
-
-    assert result.exit_code == 0
-    assert "Detect and display available toolchains" in result.output
+    assert "Detect and display available toolchains" in help_text("toolchain")
 
 
-def test_config_command_group_help(cli_runner):
+def test_config_command_group_help(help_text, assert_all_in):
     """Test config command group shows help."""
-    result = cli_runner.invoke(cli, ["config", "--help"])
-
-    assert result.exit_code == 0
-    assert "Configuration management commands" in result.output
-    assert "init" in result.output
-    assert "validate" in result.output
-    assert "show" in result.output
+    assert_all_in(
+        help_text("config"),
+        ["Configuration management commands", "init", "validate", "show"],
+    )
 
 
-def test_invalid_command(cli_runner):
+def test_invalid_command():
     """Test invalid command shows error."""
-    result = cli_runner.invoke(cli, ["invalid-command"])
+    ctx = cli.make_context("adibuild", ["invalid-command"])
 
-    assert result.exit_code != 0
-    # Click will show an error about unknown command
+    with pytest.raises(click.UsageError, match="No such command"):
+        cli.resolve_command(ctx, ["invalid-command"])
 
 
-def test_context_object_initialization(cli_runner, mocker):
+def test_context_object_initialization(cli_runner, mock_setup_logging):
     """Test that context object is properly initialized."""
-    mock_setup_logging = mocker.patch("adibuild.cli.main.setup_logging")
-
     result = cli_runner.invoke(cli, ["-v", "linux", "--help"])
 
     # Context should be initialized (tested indirectly via logging setup)
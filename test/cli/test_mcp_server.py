@@ -1,21 +1,41 @@
-import sys
 from pathlib import Path
-from unittest.mock import MagicMock, patch
-
-# Mock fastmcp and git before importing the module under test
-mock_fastmcp = MagicMock()
-mock_mcp_instance = MagicMock()
-mock_fastmcp.FastMCP.return_value = mock_mcp_instance
-# make @mcp.tool() work as a simple decorator
-mock_mcp_instance.tool.return_value = lambda f: f
-
-sys.modules["fastmcp"] = mock_fastmcp
-sys.modules["git"] = MagicMock()
-
-# Now import the module
-from adibuild import __version__  # noqa: E402
-from adibuild.cli import mcp_server  # noqa: E402
-from adibuild.core.toolchain import ToolchainInfo  # noqa: E402
+from types import SimpleNamespace
+from unittest.mock import MagicMock, create_autospec
+
+import pytest
+
+from adibuild import __version__
+from adibuild.cli import mcp_server
+from adibuild.cli.main import cli
+from adibuild.core.toolchain import ToolchainInfo
+
+_MOCKED_NAMES = (
+    "LinuxBuilder",
+    "HDLBuilder",
+    "_get_platform_instance",
+    "_load_config",
+    "BuildConfig",
+    "VivadoToolchain",
+    "ArmToolchain",
+    "SystemToolchain",
+)
+
+
+@pytest.fixture
+def mcp_mocks(monkeypatch):
+    """Replace the builders, config loading and toolchains used by the MCP tools.
+
+    Each name in _MOCKED_NAMES is autospecced from the real object, so a misspelt
+    attribute or a bad call signature fails instead of passing silently, on the
+    class and on the instances it returns alike, and is exposed as an attribute
+    of the returned namespace.
+    """
+    mocks = SimpleNamespace()
+    for name in _MOCKED_NAMES:
+        mock = create_autospec(getattr(mcp_server, name))
+        monkeypatch.setattr(mcp_server, name, mock)
+        setattr(mocks, name, mock)
+    return mocks
 
 
 class TestMCPServer:
@@ -25,37 +45,30 @@ class TestMCPServer:
         """Test get_version tool."""
         assert mcp_server.get_version() == __version__
 
-    @patch("adibuild.cli.mcp_server._load_config")
-    def test_list_platforms_success(self, mock_load_config):
+    def test_list_platforms_success(self, mcp_mocks):
         """Test list_platforms with valid config."""
         # Setup mock config
         mock_config = MagicMock()
         mock_config.to_dict.return_value = {"platforms": {"zynq": {}, "zynqmp": {}}}
-        mock_load_config.return_value = mock_config
+        mcp_mocks._load_config.return_value = mock_config
 
         platforms = mcp_server.list_platforms()
         assert "zynq" in platforms
         assert "zynqmp" in platforms
         assert len(platforms) == 2
 
-    @patch("adibuild.cli.mcp_server._load_config")
-    def test_list_platforms_error(self, mock_load_config):
+    def test_list_platforms_error(self, mcp_mocks):
         """Test list_platforms handling errors."""
-        mock_load_config.side_effect = Exception("Config error")
+        mcp_mocks._load_config.side_effect = Exception("Config error")
 
         result = mcp_server.list_platforms()
         assert len(result) == 1
         assert result[0].startswith("Error: Config error")
 
-    @patch("adibuild.cli.mcp_server.HDLBuilder")
-    @patch("adibuild.cli.mcp_server._get_platform_instance")
-    @patch("adibuild.cli.mcp_server.BuildConfig")
-    def test_build_hdl_project_success(
-        self, mock_config_cls, mock_get_platform, mock_builder_cls
-    ):
+    def test_build_hdl_project_success(self, mcp_mocks):
         """Test build_hdl_project success path."""
         # Setup mocks
-        mock_builder = mock_builder_cls.return_value
+        mock_builder = mcp_mocks.HDLBuilder.return_value
         mock_builder.build.return_value = {"output_dir": "/tmp/build"}
 
         result = mcp_server.build_hdl_project("fmcomms2", "zed")
@@ -64,31 +77,21 @@ class TestMCPServer:
         assert "/tmp/build" in result
 
         # Verify calls
-        mock_config_cls.assert_called_once()
-        mock_get_platform.assert_called_once()
+        mcp_mocks.BuildConfig.assert_called_once()
+        mcp_mocks._get_platform_instance.assert_called_once()
         mock_builder.build.assert_called_once()
 
-    @patch("adibuild.cli.mcp_server._get_platform_instance")
-    @patch("adibuild.cli.mcp_server._load_config")
-    @patch("adibuild.cli.mcp_server.HDLBuilder")
-    def test_build_hdl_project_failure(
-        self, mock_builder_cls, mock_load_config, mock_get_platform
-    ):
+    def test_build_hdl_project_failure(self, mcp_mocks):
         """Test build_hdl_project failure path."""
-        mock_builder_cls.side_effect = Exception("Build failed")
+        mcp_mocks.HDLBuilder.side_effect = Exception("Build failed")
 
         result = mcp_server.build_hdl_project("fmcomms2", "zed")
         assert "Build failed: Build failed" in result
 
-    @patch("adibuild.cli.mcp_server.LinuxBuilder")
-    @patch("adibuild.cli.mcp_server._get_platform_instance")
-    @patch("adibuild.cli.mcp_server._load_config")
-    def test_build_linux_platform_success(
-        self, mock_load, mock_get_platform, mock_builder_cls
-    ):
+    def test_build_linux_platform_success(self, mcp_mocks):
         """Test build_linux_platform success path."""
         # Setup mocks
-        mock_builder = mock_builder_cls.return_value
+        mock_builder = mcp_mocks.LinuxBuilder.return_value
         mock_builder.build.return_value = {"output_dir": "/tmp/linux_build"}
 
         result = mcp_server.build_linux_platform("zynqmp", clean=True)
@@ -96,39 +99,35 @@ class TestMCPServer:
         assert "Linux Build completed" in result
         assert "/tmp/linux_build" in result
 
-        mock_load.assert_called_once()
+        mcp_mocks._load_config.assert_called_once()
         mock_builder.build.assert_called_once()
 
-    @patch("adibuild.cli.mcp_server._load_config")
-    def test_build_linux_platform_failure(self, mock_load):
+    def test_build_linux_platform_failure(self, mcp_mocks):
         """Test build_linux_platform failure path."""
-        mock_load.side_effect = Exception("Config not found")
+        mcp_mocks._load_config.side_effect = Exception("Config not found")
 
         result = mcp_server.build_linux_platform("zynqmp")
         assert "Build failed: Config not found" in result
 
-    @patch("adibuild.cli.mcp_server.LinuxBuilder")
-    @patch("adibuild.cli.mcp_server._get_platform_instance")
-    @patch("adibuild.cli.mcp_server._load_config")
-    def test_configure_linux_platform(
-        self, mock_load, mock_get_platform, mock_builder_cls
-    ):
+    def test_configure_linux_platform(self, mcp_mocks):
         """Test configure_linux_platform."""
-        mock_builder = mock_builder_cls.return_value
+        mock_builder = mcp_mocks.LinuxBuilder.return_value
+        mock_config = mcp_mocks._load_config.return_value
+        platform_config = {"defconfig": "adi_zynqmp_defconfig"}
+        mock_config.get_platform.return_value = platform_config
 
         result = mcp_server.configure_linux_platform("zynqmp", defconfig="my_defconfig")
 
         assert "Kernel configured successfully" in result
+        assert platform_config["defconfig"] == "my_defconfig"
+        mock_config.set.assert_called_once_with("platforms.zynqmp", platform_config)
         mock_builder.prepare_source.assert_called_once()
         mock_builder.configure.assert_called_once()
-        mock_load.assert_called_once()
+        mcp_mocks._load_config.assert_called_once()
 
-    @patch("adibuild.cli.mcp_server.LinuxBuilder")
-    @patch("adibuild.cli.mcp_server._get_platform_instance")
-    @patch("adibuild.cli.mcp_server._load_config")
-    def test_build_linux_dtbs(self, mock_load, mock_get_platform, mock_builder_cls):
+    def test_build_linux_dtbs(self, mcp_mocks):
         """Test build_linux_dtbs."""
-        mock_builder = mock_builder_cls.return_value
+        mock_builder = mcp_mocks.LinuxBuilder.return_value
         mock_builder.build_dtbs.return_value = ["test.dtb"]
 
         result = mcp_server.build_linux_dtbs("zynqmp", dtb_files=["test.dtb"])
@@ -136,33 +135,27 @@ class TestMCPServer:
         assert "Built 1 DTBs successfully" in result
         mock_builder.build_dtbs.assert_called_once_with(dtbs=["test.dtb"])
 
-    @patch("adibuild.cli.mcp_server.LinuxBuilder")
-    @patch("adibuild.cli.mcp_server._get_platform_instance")
-    @patch("adibuild.cli.mcp_server._load_config")
-    def test_clean_linux_platform(self, mock_load, mock_get_platform, mock_builder_cls):
+    def test_clean_linux_platform(self, mcp_mocks):
         """Test clean_linux_platform."""
-        mock_builder = mock_builder_cls.return_value
+        mock_builder = mcp_mocks.LinuxBuilder.return_value
 
         result = mcp_server.clean_linux_platform("zynqmp", deep=True)
 
         assert "Clean completed" in result
         mock_builder.clean.assert_called_once_with(deep=True)
 
-    @patch("adibuild.cli.mcp_server.VivadoToolchain")
-    @patch("adibuild.cli.mcp_server.ArmToolchain")
-    @patch("adibuild.cli.mcp_server.SystemToolchain")
-    def test_list_toolchains(self, mock_system, mock_arm, mock_vivado):
+    def test_list_toolchains(self, mcp_mocks):
         """Test list_toolchains."""
         # Setup mocks
-        mock_vivado_inst = mock_vivado.return_value
+        mock_vivado_inst = mcp_mocks.VivadoToolchain.return_value
         mock_vivado_inst.detect.return_value = ToolchainInfo(
             type="vivado", version="2023.2", path=Path("/opt/Xilinx"), env_vars={}
         )
 
-        mock_arm_inst = mock_arm.return_value
+        mock_arm_inst = mcp_mocks.ArmToolchain.return_value
         mock_arm_inst.detect.return_value = None
 
-        mock_system_inst = mock_system.return_value
+        mock_system_inst = mcp_mocks.SystemToolchain.return_value
         mock_system_inst.detect.return_value = None
 
         result = mcp_server.list_toolchains()
@@ -171,12 +164,9 @@ class TestMCPServer:
         assert result["vivado"]["version"] == "2023.2"
         assert "arm_gnu" not in result
 
-    @patch("adibuild.cli.mcp_server.BuildConfig")
-    @patch("pathlib.Path.exists")
-    def test_validate_configuration(self, mock_exists, mock_config_cls):
+    def test_validate_configuration(self, mcp_mocks):
         """Test validate_configuration."""
-        mock_exists.return_value = True
-        mock_config = mock_config_cls.from_yaml.return_value
+        mock_config = mcp_mocks.BuildConfig.from_yaml.return_value
 
         result = mcp_server.validate_configuration("config.yaml")
 
@@ -185,6 +175,4 @@ class TestMCPServer:
 
     def test_cli_integration(self):
         """Test that 'mcp' command is registered in CLI."""
-        from adibuild.cli.main import cli
-
         assert "mcp" in cli.commands
@@ -1,20 +1,37 @@
 """CLI tests for no-OS build commands."""
 
-import pytest
-from click.testing import CliRunner
+from unittest.mock import MagicMock
 
-from adibuild.cli.main import cli
+import click
+import pytest
 
+from adibuild.cli.helpers import get_platform_instance
+from adibuild.cli.main import build_noos, cli
+from adibuild.platforms.noos import NoOSPlatform
+from adibuild.projects import noos as noos_project
 
-@pytest.fixture
-def cli_runner():
-    return CliRunner()
+# Single xilinx_ad9081 platform; platform_extra is spliced into its settings
+_XILINX_CONFIG_TEMPLATE = """
+project: noos
+repository: https://github.com/analogdevicesinc/no-OS.git
+tag: 2023_R2
+build:
+  parallel_jobs: 4
+  output_dir: ./build
+platforms:
+  xilinx_ad9081:
+    noos_platform: xilinx
+    noos_project: ad9081_fmca_ebz
+{platform_extra}    toolchain:
+      preferred: vivado
+      fallback: []
+"""
 
 
-@pytest.fixture
-def noos_config_file(tmp_path):
-    """Create a temporary valid no-OS config file."""
-    config_file = tmp_path / "noos_config.yaml"
+@pytest.fixture(scope="session")
+def noos_config_file(tmp_path_factory):
+    """Write a valid no-OS config file once; tests must not modify it."""
+    config_file = tmp_path_factory.mktemp("noos_cfg") / "noos_config.yaml"
     config_file.write_text("""
 project: noos
 repository: https://github.com/analogdevicesinc/no-OS.git
@@ -44,43 +61,59 @@ platforms:
     return config_file
 
 
+@pytest.fixture
+def noos_repo(monkeypatch):
+    """Replace the no-OS GitRepository, which script generation still constructs."""
+    mock_repo_cls = MagicMock()
+    mock_repo_cls.return_value.get_commit_sha.return_value = "abc123def456"
+    monkeypatch.setattr(noos_project, "GitRepository", mock_repo_cls)
+    return mock_repo_cls.return_value
+
+
 class TestNoOSCLI:
-    def test_noos_help(self, cli_runner):
+    def test_noos_help(self, help_text):
         """Test that noos group shows help."""
-        result = cli_runner.invoke(cli, ["noos", "--help"])
-        assert result.exit_code == 0
-        assert "bare-metal" in result.output.lower() or "no-os" in result.output.lower()
+        output = help_text("noos").lower()
+        assert "bare-metal" in output or "no-os" in output
 
-    def test_noos_build_help(self, cli_runner):
+    def test_noos_build_help(self, help_text, assert_all_in):
         """Test that noos build subcommand shows help."""
-        result = cli_runner.invoke(cli, ["noos", "build", "--help"])
-        assert result.exit_code == 0
-        assert "--platform" in result.output
-        assert "--tag" in result.output
-        assert "--generate-script" in result.output
+        assert_all_in(
+            help_text("noos", "build"), ["--platform", "--tag", "--generate-script"]
+        )
 
-    def test_noos_clean_help(self, cli_runner):
+    def test_noos_clean_help(self, help_text, assert_all_in):
         """Test that noos clean subcommand shows help."""
-        result = cli_runner.invoke(cli, ["noos", "clean", "--help"])
-        assert result.exit_code == 0
-        assert "--platform" in result.output
-        assert "--deep" in result.output
-
-    def test_noos_build_script_generation_xilinx(
-        self, cli_runner, noos_config_file, mocker, tmp_path
+        assert_all_in(help_text("noos", "clean"), ["--platform", "--deep"])
+
+    @pytest.mark.parametrize(
+        "platform_extra,expected",
+        [
+            pytest.param(
+                "    iiod: false\n", ["PLATFORM=xilinx", "NO-OS=", "make"], id="xilinx"
+            ),
+            pytest.param("    iiod: true\n", ["IIOD=y"], id="iiod"),
+            pytest.param(
+                "    profile: vcu118_ad9081_m8_l4\n    iiod: false\n",
+                ["PROFILE=vcu118_ad9081_m8_l4"],
+                id="profile",
+            ),
+        ],
+    )
+    def test_noos_build_script_generation(
+        self, cli_runner, fake_home, noos_repo, assert_all_in, platform_extra, expected
     ):
-        """Test generating a build script for no-OS Xilinx project."""
-        mocker.patch("pathlib.Path.home", return_value=tmp_path)
-
-        mock_repo_cls = mocker.patch("adibuild.projects.noos.GitRepository")
-        mock_repo = mock_repo_cls.return_value
-        mock_repo.get_commit_sha.return_value = "abc123def456"
+        """Test generating a no-OS Xilinx build script from the platform config."""
+        config_file = fake_home / "config.yaml"
+        config_file.write_text(
+            _XILINX_CONFIG_TEMPLATE.format(platform_extra=platform_extra)
+        )
 
         result = cli_runner.invoke(
             cli,
             [
                 "--config",
-                str(noos_config_file),
+                str(config_file),
                 "noos",
                 "build",
                 "-p",
@@ -92,121 +125,17 @@ class TestNoOSCLI:
         assert result.exit_code == 0, f"Command failed: {result.output}"
 
         # Verify script file exists
-        work_dir = tmp_path / ".adibuild" / "work"
+        work_dir = fake_home / ".adibuild" / "work"
         script_file = work_dir / "build_noos_bare_metal.sh"
         assert script_file.exists(), (
             f"Script file not found. Work dir contents: "
             f"{list(work_dir.iterdir()) if work_dir.exists() else 'not found'}"
         )
-
-        content = script_file.read_text()
-        assert "PLATFORM=xilinx" in content
-        assert "NO-OS=" in content
-        assert "make" in content
-
-    def test_noos_build_script_has_iiod_flag(self, cli_runner, tmp_path, mocker):
-        """Test that script includes IIOD flag."""
-        mocker.patch("pathlib.Path.home", return_value=tmp_path)
-
-        mock_repo_cls = mocker.patch("adibuild.projects.noos.GitRepository")
-        mock_repo = mock_repo_cls.return_value
-        mock_repo.get_commit_sha.return_value = "abc123def456"
-
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("""
-project: noos
-repository: https://github.com/analogdevicesinc/no-OS.git
-tag: 2023_R2
-build:
-  parallel_jobs: 4
-  output_dir: ./build
-platforms:
-  xilinx_ad9081:
-    noos_platform: xilinx
-    noos_project: ad9081_fmca_ebz
-    iiod: true
-    toolchain:
-      preferred: vivado
-      fallback: []
-""")
-
-        result = cli_runner.invoke(
-            cli,
-            [
-                "--config",
-                str(config_file),
-                "noos",
-                "build",
-                "-p",
-                "xilinx_ad9081",
-                "--generate-script",
-            ],
-        )
-
-        assert result.exit_code == 0, f"Command failed: {result.output}"
-
-        work_dir = tmp_path / ".adibuild" / "work"
-        script_file = work_dir / "build_noos_bare_metal.sh"
-        assert script_file.exists()
-        content = script_file.read_text()
-        assert "IIOD=y" in content
-
-    def test_noos_build_script_with_profile(self, cli_runner, tmp_path, mocker):
-        """Test that script includes PROFILE when specified."""
-        mocker.patch("pathlib.Path.home", return_value=tmp_path)
-
-        mock_repo_cls = mocker.patch("adibuild.projects.noos.GitRepository")
-        mock_repo = mock_repo_cls.return_value
-        mock_repo.get_commit_sha.return_value = "abc123def456"
-
-        config_file = tmp_path / "config.yaml"
-        config_file.write_text("""
-project: noos
-repository: https://github.com/analogdevicesinc/no-OS.git
-tag: 2023_R2
-build:
-  parallel_jobs: 4
-  output_dir: ./build
-platforms:
-  xilinx_ad9081:
-    noos_platform: xilinx
-    noos_project: ad9081_fmca_ebz
-    profile: vcu118_ad9081_m8_l4
-    iiod: false
-    toolchain:
-      preferred: vivado
-      fallback: []
-""")
-
-        result = cli_runner.invoke(
-            cli,
-            [
-                "--config",
-                str(config_file),
-                "noos",
-                "build",
-                "-p",
-                "xilinx_ad9081",
-                "--generate-script",
-            ],
-        )
-
-        assert result.exit_code == 0, f"Command failed: {result.output}"
-
-        work_dir = tmp_path / ".adibuild" / "work"
-        script_file = work_dir / "build_noos_bare_metal.sh"
-        content = script_file.read_text()
-        assert "PROFILE=vcu118_ad9081_m8_l4" in content
+        assert_all_in(script_file.read_text(), expected)
 
     def test_noos_build_docker_script_generation(
-        self, cli_runner, noos_config_file, mocker, tmp_path
+        self, cli_runner, noos_config_file, noos_repo, fake_home
     ):
-        mocker.patch("pathlib.Path.home", return_value=tmp_path)
-
-        mock_repo_cls = mocker.patch("adibuild.projects.noos.GitRepository")
-        mock_repo = mock_repo_cls.return_value
-        mock_repo.get_commit_sha.return_value = "abc123def456"
-
         result = cli_runner.invoke(
             cli,
             [
@@ -226,22 +155,16 @@ platforms:
 
         assert result.exit_code == 0, result.output
 
-        script_file = tmp_path / ".adibuild" / "work" / "build_noos_bare_metal.sh"
+        script_file = fake_home / ".adibuild" / "work" / "build_noos_bare_metal.sh"
         content = script_file.read_text()
         assert "docker run --rm" in content
         assert "custom/vivado:2023.2" in content
 
     def test_noos_build_hardware_file_override(
-        self, cli_runner, noos_config_file, mocker, tmp_path
+        self, cli_runner, noos_config_file, noos_repo, fake_home
     ):
         """Test that --hardware-file CLI arg overrides config."""
-        mocker.patch("pathlib.Path.home", return_value=tmp_path)
-
-        mock_repo_cls = mocker.patch("adibuild.projects.noos.GitRepository")
-        mock_repo = mock_repo_cls.return_value
-        mock_repo.get_commit_sha.return_value = "abc123def456"
-
-        hw_file = tmp_path / "my_design.xsa"
+        hw_file = fake_home / "my_design.xsa"
         hw_file.write_text("dummy")
 
         result = cli_runner.invoke(
@@ -262,30 +185,18 @@ platforms:
         # Should not error about the hardware file path (generate-script doesn't validate)
         assert result.exit_code == 0, f"Command failed: {result.output}"
 
-    def test_noos_build_missing_platform_flag(self, cli_runner, noos_config_file):
+    def test_noos_build_missing_platform_flag(self):
         """Test that missing --platform flag causes error."""
-        result = cli_runner.invoke(
-            cli,
-            [
-                "--config",
-                str(noos_config_file),
-                "noos",
-                "build",
-            ],
-        )
-        # Should fail with missing required option
-        assert result.exit_code != 0
+        with pytest.raises(click.MissingParameter) as exc_info:
+            build_noos.make_context("build", [])
+        assert exc_info.value.param.name == "platform"
 
-    def test_noos_clean_script(self, cli_runner, noos_config_file, mocker, tmp_path):
+    def test_noos_clean_script(
+        self, cli_runner, noos_config_file, mocker, noos_repo, fake_home
+    ):
         """Test clean command routes correctly to NoOSBuilder.clean."""
-        mocker.patch("pathlib.Path.home", return_value=tmp_path)
-
-        mock_repo_cls = mocker.patch("adibuild.projects.noos.GitRepository")
-        mock_repo = mock_repo_cls.return_value
-        mock_repo.get_commit_sha.return_value = "abc123def456"
-
         # Create the noos source dir so clean can find project
-        noos_dir = tmp_path / ".adibuild" / "repos" / "noos"
+        noos_dir = fake_home / ".adibuild" / "repos" / "noos"
         project_dir = noos_dir / "projects" / "ad9081_fmca_ebz"
         project_dir.mkdir(parents=True)
 
@@ -308,15 +219,9 @@ platforms:
         assert "Clean completed" in result.output
 
     def test_noos_tag_auto_detects_tool_version(
-        self, cli_runner, noos_config_file, mocker, tmp_path
+        self, cli_runner, noos_config_file, noos_repo, fake_home
     ):
         """Test that tag 2023_R2 auto-detects tool version 2023.2."""
-        mocker.patch("pathlib.Path.home", return_value=tmp_path)
-
-        mock_repo_cls = mocker.patch("adibuild.projects.noos.GitRepository")
-        mock_repo = mock_repo_cls.return_value
-        mock_repo.get_commit_sha.return_value = "abc123def456"
-
         result = cli_runner.invoke(
             cli,
             [
@@ -336,29 +241,8 @@ platforms:
         # Auto-detection message should appear
         assert "2023.2" in result.output
 
-    def test_noos_platform_dispatch_in_get_platform_instance(self, tmp_path):
+    def test_noos_platform_dispatch_in_get_platform_instance(self, noos_config):
         """Test that get_platform_instance correctly dispatches to NoOSPlatform."""
-        from adibuild.cli.helpers import get_platform_instance
-        from adibuild.core.config import BuildConfig
-        from adibuild.platforms.noos import NoOSPlatform
-
-        config = BuildConfig.from_dict(
-            {
-                "project": "noos",
-                "repository": "https://github.com/analogdevicesinc/no-OS.git",
-                "tag": "2023_R2",
-                "build": {"parallel_jobs": 4},
-                "platforms": {
-                    "xilinx_ad9081": {
-                        "noos_platform": "xilinx",
-                        "noos_project": "ad9081_fmca_ebz",
-                        "iiod": False,
-                        "toolchain": {"preferred": "vivado"},
-                    }
-                },
-            }
-        )
-
-        platform = get_platform_instance(config, "xilinx_ad9081")
+        platform = get_platform_instance(noos_config, "xilinx_ad9081")
         assert isinstance(platform, NoOSPlatform)
         assert platform.noos_platform == "xilinx"
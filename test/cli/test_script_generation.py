@@ -7,7 +7,7 @@ def test_generate_script_zynqmp(cli_runner, tmp_path, mocker):
     """Test generating a build script for ZynqMP."""
 
     # Mock home directory to use tmp_path
-    mocker.patch("pathlib.Path.home", return_value=tmp_path)
+    mocker.patch("adibuild.utils.paths._home", return_value=tmp_path)
 
     # Run the build command with --generate-script and -v for logging
     result = cli_runner.invoke(
@@ -42,7 +42,7 @@ def test_generate_script_zynqmp(cli_runner, tmp_path, mocker):
 def test_generate_script_microblaze(cli_runner, tmp_path, mocker):
     """Test generating a build script for MicroBlaze."""
 
-    mocker.patch("pathlib.Path.home", return_value=tmp_path)
+    mocker.patch("adibuild.utils.paths._home", return_value=tmp_path)
 
     result = cli_runner.invoke(
         cli, ["linux", "build", "-p", "microblaze", "--generate-script"]
@@ -66,7 +66,7 @@ def test_generate_script_microblaze(cli_runner, tmp_path, mocker):
 def test_generate_script_with_custom_config(cli_runner, tmp_path, mocker):
     """Test generating script with custom config file."""
 
-    mocker.patch("pathlib.Path.home", return_value=tmp_path)
+    mocker.patch("adibuild.utils.paths._home", return_value=tmp_path)
 
     # Create a dummy config file
     config_file = tmp_path / "custom_config"
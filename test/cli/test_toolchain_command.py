@@ -2,7 +2,11 @@
 
 from pathlib import Path
 
-from adibuild.cli.main import cli
+import click
+import pytest
+
+from adibuild.cli.main import cli, toolchain
+from adibuild.core.config import BuildConfig
 from adibuild.core.toolchain import ToolchainInfo
 
 
@@ -45,8 +49,6 @@ def test_toolchain_platform_specific_zynqmp(
 ):
     """Test toolchain command for specific platform (zynqmp)."""
     # Mock config loading
-    from adibuild.core.config import BuildConfig
-
     config_data = {
         "project": "linux",
         "repository": "https://github.com/analogdevicesinc/linux.git",
@@ -79,8 +81,6 @@ def test_toolchain_platform_specific_zynqmp(
 
 def test_toolchain_platform_specific_zynq(cli_runner, mock_toolchain_vivado, mocker):
     """Test toolchain command for specific platform (zynq)."""
-    from adibuild.core.config import BuildConfig
-
     config_data = {
         "project": "linux",
         "repository": "https://github.com/analogdevicesinc/linux.git",
@@ -128,8 +128,6 @@ def test_toolchain_with_custom_config(
     cli_runner, mock_toolchain_vivado, mock_config_file, mocker
 ):
     """Test toolchain command with custom config file."""
-    from adibuild.core.config import BuildConfig
-
     config_data = {
         "project": "linux",
         "repository": "https://github.com/analogdevicesinc/linux.git",
@@ -160,12 +158,10 @@ def test_toolchain_with_custom_config(
     assert "zynqmp" in result.output.lower()
 
 
-def test_toolchain_invalid_platform(cli_runner):
+def test_toolchain_invalid_platform():
     """Test toolchain command with invalid platform."""
-    result = cli_runner.invoke(cli, ["toolchain", "-p", "invalid"])
-
-    assert result.exit_code != 0
-    assert "Invalid value" in result.output or "invalid" in result.output.lower()
+    with pytest.raises(click.BadParameter, match="'invalid' is not one of"):
+        toolchain.make_context("toolchain", ["-p", "invalid"])
 
 
 def test_toolchain_display_format(cli_runner, mock_toolchain_all):
@@ -1,6 +1,7 @@
 """Pytest configuration and fixtures."""
 
 import sys
+from collections.abc import Iterable
 from unittest import mock
 from unittest.mock import MagicMock
 
@@ -112,12 +113,31 @@ def pytest_collection_modifyitems(config, items):
                 item.add_marker(skip_cmake)
 
 
+def _assert_all_in(haystack: str, needles: Iterable[str]) -> None:
+    """Assert every needle occurs in haystack, reporting all missing ones at once."""
+    missing = [needle for needle in needles if needle not in haystack]
+    assert not missing, f"Missing from output: {missing}"
+
+
+@pytest.fixture
+def assert_all_in():
+    """Batch substring assertion helper for generated scripts and CLI output."""
+    return _assert_all_in
+
+
 @pytest.fixture
 def tmp_dir(tmp_path):
     """Temporary directory for tests."""
     return tmp_path
 
 
+@pytest.fixture
+def fake_home(tmp_path, mocker):
+    """Point the user home directory used by adibuild at tmp_path."""
+    mocker.patch("adibuild.utils.paths._home", return_value=tmp_path)
+    return tmp_path
+
+
 @pytest.fixture
 def tmp_repo(tmp_path):
     """Create a temporary git repository."""
@@ -0,0 +1,84 @@
+"""Unit tests for ArmToolchain downloads."""
+
+import io
+import tarfile
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from adibuild.core.toolchain import ArmToolchain, ToolchainError
+
+VERSION = "12.2.rel1"
+TARGET = "arm-none-linux-gnueabihf"
+TOOLCHAIN_DIR = f"arm-gnu-toolchain-{VERSION}-x86_64-{TARGET}"
+
+
+def _make_tar_xz(top_dir: str) -> bytes:
+    """Build an in-memory .tar.xz with a single gcc stub under top_dir."""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:xz") as tar:
+        data = b"#!/bin/sh\n"
+        info = tarfile.TarInfo(f"{top_dir}/bin/{TARGET}-gcc")
+        info.size = len(data)
+        tar.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+def _mock_response(payload: bytes) -> MagicMock:
+    response = MagicMock()
+    response.headers = {"content-length": str(len(payload))}
+    response.raw = io.BytesIO(payload)
+    return response
+
+
+class TestArmToolchainDownload:
+    def test_download_extracts_toolchain(self, tmp_path):
+        tc = ArmToolchain(cache_dir=tmp_path)
+        payload = _make_tar_xz(TOOLCHAIN_DIR)
+        with patch.object(tc.session, "get", return_value=_mock_response(payload)):
+            result = tc._download_toolchain(VERSION, TARGET)
+
+        assert result == tmp_path / TOOLCHAIN_DIR
+        assert (result / "bin" / f"{TARGET}-gcc").read_bytes() == b"#!/bin/sh\n"
+
+    def test_download_skips_existing_toolchain(self, tmp_path):
+        (tmp_path / TOOLCHAIN_DIR).mkdir()
+        tc = ArmToolchain(cache_dir=tmp_path)
+        with patch.object(tc.session, "get") as mock_get:
+            result = tc._download_toolchain(VERSION, TARGET)
+
+        assert result == tmp_path / TOOLCHAIN_DIR
+        mock_get.assert_not_called()
+
+    def test_download_raises_when_archive_layout_unexpected(self, tmp_path):
+        tc = ArmToolchain(cache_dir=tmp_path)
+        payload = _make_tar_xz("unexpected-dir")
+        with patch.object(tc.session, "get", return_value=_mock_response(payload)):
+            with pytest.raises(ToolchainError, match="does not contain"):
+                tc._download_toolchain(VERSION, TARGET)
+
+    def test_download_truncated_archive_leaves_no_toolchain(self, tmp_path):
+        tc = ArmToolchain(cache_dir=tmp_path)
+        payload = _make_tar_xz(TOOLCHAIN_DIR)
+        payload = payload[: len(payload) // 2]
+        with patch.object(tc.session, "get", return_value=_mock_response(payload)):
+            with pytest.raises(ToolchainError):
+                tc._download_toolchain(VERSION, TARGET)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_download_fetches_both_targets(self, tmp_path):
+        tc = ArmToolchain(cache_dir=tmp_path)
+        with patch.object(
+            tc, "_download_toolchain", side_effect=lambda v, t: tmp_path / t
+        ) as mock_download:
+            info = tc.download()
+
+        assert mock_download.call_count == 2
+        targets = {call.args[1] for call in mock_download.call_args_list}
+        assert targets == {"arm-none-linux-gnueabihf", "aarch64-none-linux-gnu"}
+        assert info.version == VERSION
+        assert info.env_vars["PATH"].startswith(
+            f"{tmp_path / 'arm-none-linux-gnueabihf' / 'bin'}:"
+            f"{tmp_path / 'aarch64-none-linux-gnu' / 'bin'}:"
+        )
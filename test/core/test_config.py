@@ -5,7 +5,13 @@ import json
 import pytest
 import yaml
 
-from adibuild.core.config import BuildConfig, ConfigurationError
+from adibuild.core.config import (
+    _YAML_LOADER,
+    BuildConfig,
+    ConfigurationError,
+    _get_validator,
+    default_schema_path,
+)
 
 
 def test_build_config_from_dict():
@@ -30,6 +36,62 @@ def test_build_config_from_yaml(tmp_path):
     assert config.get("tag") == "2023_R2"
 
 
+def test_build_config_from_yaml_reuses_parse(tmp_path, mocker):
+    """Test repeated loads of an unchanged file parse it only once."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("project: linux\ntag: 2023_R2\n")
+    spy = mocker.patch("adibuild.core.config.yaml.load", wraps=yaml.load)
+
+    first = BuildConfig.from_yaml(config_file)
+    first.set("tag", "main")
+    second = BuildConfig.from_yaml(config_file)
+
+    assert spy.call_count == 1
+    assert second.get("tag") == "2023_R2"
+
+
+def test_build_config_from_yaml_sees_edits(tmp_path):
+    """Test rewriting a config file invalidates the parse cache."""
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("project: linux\n")
+    assert BuildConfig.from_yaml(config_file).get("project") == "linux"
+
+    config_file.write_text("project: hdl\ntag: main\n")
+    assert BuildConfig.from_yaml(config_file).get("project") == "hdl"
+
+
+def test_build_config_validate_compiles_schema_once(tmp_path):
+    """Test the schema validator is built once and reports validation errors."""
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text(
+        json.dumps({"type": "object", "required": ["project", "repository"]})
+    )
+    _get_validator.cache_clear()
+
+    config = BuildConfig.from_dict({"project": "linux", "repository": "url"})
+    assert config.validate(schema_file)
+    with pytest.raises(ConfigurationError, match="'repository' is a required"):
+        BuildConfig.from_dict({"project": "linux"}).validate(schema_file)
+
+    assert _get_validator.cache_info().misses == 1
+
+
+def test_schema_path_resolved_once():
+    """Test the bundled schema path is resolved once and points at a real file."""
+    path = default_schema_path()
+
+    assert path.is_file()
+    assert default_schema_path() is path
+
+
+@pytest.mark.skipif(
+    not hasattr(yaml, "CSafeLoader"), reason="PyYAML built without LibYAML"
+)
+def test_yaml_loader_prefers_libyaml():
+    """Test configs are parsed with the LibYAML safe loader when it is available."""
+    assert _YAML_LOADER is yaml.CSafeLoader
+
+
 def test_build_config_from_json(tmp_path):
     """Test loading BuildConfig from JSON file."""
     config_file = tmp_path / "config.json"
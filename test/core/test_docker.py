@@ -39,7 +39,7 @@ def test_build_docker_execution_config_collects_workspace_and_cache(tmp_path, mo
     hw_file = hw_dir / "system.xsa"
     hw_file.write_text("xsa")
 
-    mocker.patch("pathlib.Path.home", return_value=home)
+    mocker.patch("adibuild.utils.paths._home", return_value=home)
 
     config = {
         "build": {"output_dir": "./build"},
@@ -5,15 +5,17 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from adibuild.utils.paths import adibuild_home
+
 
 @pytest.fixture
 def mock_git_repo_for_examples(mocker, mock_kernel_source, mock_toolchain, tmp_path):
     """Mock GitRepository and toolchain for example tests with proper setup."""
-    # Mock Path.home() to return a temp directory so repo_cache uses tmp_path
+    # Redirect the home directory to a temp directory so repo_cache uses tmp_path
     # This ensures that prepare_source() sets source_dir to tmp_path instead of real home
     mock_home = tmp_path / "home"
     mock_home.mkdir()
-    mocker.patch("pathlib.Path.home", return_value=mock_home)
+    mocker.patch("adibuild.utils.paths._home", return_value=mock_home)
 
     # Create the expected directory structure and symlink to mock_kernel_source
     # So when LinuxBuilder sets source_dir = repo_cache, it points to our mock
@@ -29,7 +31,7 @@ def mock_git_repo_for_examples(mocker, mock_kernel_source, mock_toolchain, tmp_p
         """Mock __init__ that sets up the repo property correctly."""
         self.url = url
         self.local_path = Path(local_path)
-        self.cache_dir = cache_dir or Path.home() / ".adibuild" / "repos"
+        self.cache_dir = cache_dir or adibuild_home() / "repos"
         self.logger = MagicMock()
         self.script_builder = script_builder
         # This is the key: set repo to a MagicMock so it's not None
@@ -10,7 +10,7 @@ from adibuild.cli.main import cli
 def test_cli_linux_build_zynqmp_flow(mocker, tmp_path):
     """Test full ZynqMP linux build flow in CLI."""
     # Mock home to avoid touching real ~/.adibuild
-    mocker.patch("pathlib.Path.home", return_value=tmp_path)
+    mocker.patch("adibuild.utils.paths._home", return_value=tmp_path)
 
     # Mock executor to avoid real tool calls
     mock_execute = mocker.patch("adibuild.core.executor.BuildExecutor.execute")
@@ -35,7 +35,7 @@ def test_cli_linux_build_zynqmp_flow(mocker, tmp_path):
 
 def test_cli_hdl_build_flow(mocker, tmp_path):
     """Test full HDL build flow in CLI."""
-    mocker.patch("pathlib.Path.home", return_value=tmp_path)
+    mocker.patch("adibuild.utils.paths._home", return_value=tmp_path)
 
     # Create a mock config file
     config_file = tmp_path / "hdl_config.yaml"
@@ -78,7 +78,7 @@ def test_cli_hdl_build_flow(mocker, tmp_path):
 
 def test_cli_noos_build_flow(mocker, tmp_path):
     """Test full no-OS build flow in CLI."""
-    mocker.patch("pathlib.Path.home", return_value=tmp_path)
+    mocker.patch("adibuild.utils.paths._home", return_value=tmp_path)
 
     # Create a mock config file
     config_file = tmp_path / "noos_config.yaml"
@@ -18,7 +18,7 @@ class TestRealNoOSBuild:
         We still mock the actual compiler execution to keep it fast in CI
         unless we really want to wait for a full no-OS clone.
         """
-        mocker.patch("pathlib.Path.home", return_value=tmp_path)
+        mocker.patch("adibuild.utils.paths._home", return_value=tmp_path)
         config_data = {
             "project": "noos",
             "repository": "https://github.com/analogdevicesinc/no-OS.git",
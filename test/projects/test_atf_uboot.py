@@ -13,7 +13,7 @@ from adibuild.projects.uboot import UBootBuilder
 # ---------------------------------------------------------------------------
 
 
-def _make_config(project, extra=None):
+def _make_config(project, output_dir, extra=None):
     """Build a minimal BuildConfig for tests."""
     platform_cfg = {
         "arch": "arm64",
@@ -27,7 +27,7 @@ def _make_config(project, extra=None):
     data = {
         "project": project,
         "tag": "main",
-        "build": {"parallel_jobs": 4, "output_dir": "./build"},
+        "build": {"parallel_jobs": 4, "output_dir": str(output_dir)},
         "platforms": {"zynqmp": platform_cfg},
     }
     return BuildConfig.from_dict(data), ZynqMPPlatform(platform_cfg)
@@ -40,7 +40,7 @@ def _make_config(project, extra=None):
 
 class TestATFBuilder:
     def test_build_flow(self, tmp_path, mocker):
-        config, platform = _make_config("atf")
+        config, platform = _make_config("atf", tmp_path / "build")
         builder = ATFBuilder(config, platform, work_dir=tmp_path / "work")
 
         # Mock source preparation
@@ -80,7 +80,7 @@ class TestATFBuilder:
 
 class TestUBootBuilder:
     def test_build_flow(self, tmp_path, mocker):
-        config, platform = _make_config("uboot")
+        config, platform = _make_config("uboot", tmp_path / "build")
         builder = UBootBuilder(config, platform, work_dir=tmp_path / "work")
 
         # Mock source preparation
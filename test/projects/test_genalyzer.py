@@ -4,7 +4,9 @@ import json
 from pathlib import Path
 
 import pytest
+from click.testing import CliRunner
 
+from adibuild.cli.main import cli
 from adibuild.core.config import BuildConfig
 from adibuild.platforms.lib import DEFAULT_CROSS_COMPILE, LibPlatform
 from adibuild.projects.genalyzer import GenalyzerBuilder
@@ -422,20 +424,12 @@ class TestGenalyzerCLI:
         return cfg
 
     def test_genalyzer_help(self):
-        from click.testing import CliRunner
-
-        from adibuild.cli.main import cli
-
         runner = CliRunner()
         result = runner.invoke(cli, ["genalyzer", "--help"])
         assert result.exit_code == 0
         assert "genalyzer" in result.output.lower()
 
     def test_genalyzer_build_help(self):
-        from click.testing import CliRunner
-
-        from adibuild.cli.main import cli
-
         runner = CliRunner()
         result = runner.invoke(cli, ["genalyzer", "build", "--help"])
         assert result.exit_code == 0
@@ -444,20 +438,12 @@ class TestGenalyzerCLI:
         assert "--generate-script" in result.output
 
     def test_genalyzer_clean_help(self):
-        from click.testing import CliRunner
-
-        from adibuild.cli.main import cli
-
         runner = CliRunner()
         result = runner.invoke(cli, ["genalyzer", "clean", "--help"])
         assert result.exit_code == 0
         assert "--deep" in result.output
 
     def test_genalyzer_build_script_native(self, tmp_path, mocker):
-        from click.testing import CliRunner
-
-        from adibuild.cli.main import cli
-
         cfg = self._make_config_file(tmp_path)
 
         mocker.patch("adibuild.projects.genalyzer.GitRepository")
@@ -480,10 +466,6 @@ class TestGenalyzerCLI:
         assert result.exit_code == 0
 
     def test_genalyzer_build_script_has_cmake_flags(self, tmp_path, mocker):
-        from click.testing import CliRunner
-
-        from adibuild.cli.main import cli
-
         cfg = self._make_config_file(tmp_path)
 
         mocker.patch("adibuild.projects.genalyzer.GitRepository")
@@ -517,10 +499,6 @@ class TestGenalyzerCLI:
             assert "BUILD_DOC=OFF" in content
 
     def test_genalyzer_missing_platform_flag(self, tmp_path):
-        from click.testing import CliRunner
-
-        from adibuild.cli.main import cli
-
         cfg = self._make_config_file(tmp_path)
         runner = CliRunner()
         result = runner.invoke(cli, ["--config", str(cfg), "genalyzer", "build"])
@@ -528,10 +506,6 @@ class TestGenalyzerCLI:
         assert "platform" in result.output.lower() or "missing" in result.output.lower()
 
     def test_genalyzer_fftw_path_override(self, tmp_path, mocker):
-        from click.testing import CliRunner
-
-        from adibuild.cli.main import cli
-
         cfg = self._make_config_file(tmp_path)
 
         captured = {}
@@ -42,8 +42,8 @@ def test_prepare_source(hdl_config, mocker, tmp_path):
     mock_repo_instance = mock_repo.return_value
     mock_repo_instance.get_commit_sha.return_value = "12345678"
 
-    # Mock Path.home to redirect cache
-    mocker.patch("pathlib.Path.home", return_value=tmp_path)
+    # Redirect the adibuild home directory to tmp
+    mocker.patch("adibuild.utils.paths._home", return_value=tmp_path)
 
     # Mock source_dir.exists()
     # We need to mock Path.exists but it's tricky to mock specifically for source_dir
@@ -256,7 +256,7 @@ class TestNoOSBuilder:
         mock_repo = mock_repo_cls.return_value
         mock_repo.get_commit_sha.return_value = "abc123def456"
 
-        mocker.patch("pathlib.Path.home", return_value=tmp_path)
+        mocker.patch("adibuild.utils.paths._home", return_value=tmp_path)
         repo_path = tmp_path / ".adibuild" / "repos" / "noos"
         repo_path.mkdir(parents=True)
 
@@ -514,7 +514,7 @@ class TestNoOSBuilder:
     def test_build_script_mode(
         self, noos_build_config, xilinx_platform_config, mocker, tmp_path
     ):
-        mocker.patch("pathlib.Path.home", return_value=tmp_path)
+        mocker.patch("adibuild.utils.paths._home", return_value=tmp_path)
         platform = NoOSPlatform(xilinx_platform_config)
 
         builder = NoOSBuilder(noos_build_config, platform, script_mode=True)
@@ -117,6 +117,16 @@ def test_script_builder_basic(tmp_path):
     assert "ls -l" in content
 
 
+def test_script_builder_render_command():
+    """Test a command block renders as one exact chunk of script text."""
+    block = ScriptBuilder._render_command(
+        ["make", "X=a b"], cwd=Path("/tmp"), env={"FOO": "bar"}
+    )
+
+    assert block == "\nmkdir -p /tmp\ncd /tmp\nexport FOO='bar'\nmake 'X=a b'\n"
+    assert ScriptBuilder._render_command("ls") == "\nls\n"
+
+
 def test_executor_execute_streaming(mocker):
     """Test execution with streaming output."""
     mock_process = mocker.Mock()
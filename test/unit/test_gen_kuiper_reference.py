@@ -0,0 +1,54 @@
+"""Tests for the Kuiper reference generator script."""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("tqdm")
+sys.path.insert(0, str(Path(__file__).parents[2] / "scripts"))
+
+import gen_kuiper_reference  # noqa: E402
+
+
+@pytest.fixture
+def parse_with_threshold(monkeypatch):
+    """Make parse_kuiper_release resolve every devicetree only at or below a score."""
+
+    def install(threshold, raise_above=False):
+        scores = []
+
+        def parse(release_version, files, score_required):
+            scores.append(score_required)
+            if score_required <= threshold:
+                return {"score": score_required}, []
+            if raise_above:
+                raise gen_kuiper_reference.NoDTSFoundError("no devicetrees")
+            return {"score": score_required}, ["missing.dts"]
+
+        monkeypatch.setattr(gen_kuiper_reference, "parse_kuiper_release", parse)
+        return scores
+
+    return install
+
+
+@pytest.mark.parametrize("raise_above", [False, True], ids=["not_found", "no_dts"])
+def test_find_release_metadata_picks_strictest_resolving_score(
+    parse_with_threshold, raise_above
+):
+    """Test the bisect returns the highest score that still resolves everything."""
+    scores = parse_with_threshold(0.93, raise_above=raise_above)
+
+    metadata = gen_kuiper_reference.find_release_metadata("2023_R2", [])
+
+    assert metadata == {"score": 0.93}
+    assert 0.90 not in scores
+
+
+def test_find_release_metadata_falls_back_when_nothing_resolves(parse_with_threshold):
+    """Test the last partial parse is returned when no score resolves everything."""
+    parse_with_threshold(0.0)
+
+    metadata = gen_kuiper_reference.find_release_metadata("2023_R2", [])
+
+    assert metadata == {"score": 0.90}
@@ -0,0 +1,20 @@
+"""Tests for adibuild filesystem locations."""
+
+from pathlib import Path
+
+from adibuild.utils.git import GitRepository
+from adibuild.utils.paths import adibuild_home
+
+
+def test_adibuild_home_defaults_to_user_home():
+    """Test the state directory lives under the user's home directory."""
+    assert adibuild_home() == Path.home() / ".adibuild"
+
+
+def test_adibuild_home_follows_patched_home(mocker, tmp_path):
+    """Test patching _home redirects locations derived from adibuild_home."""
+    mocker.patch("adibuild.utils.paths._home", return_value=tmp_path)
+
+    assert adibuild_home() == tmp_path / ".adibuild"
+    repo = GitRepository("https://example.com/repo.git", tmp_path / "repo")
+    assert repo.cache_dir == tmp_path / ".adibuild" / "repos"